@@ -2,14 +2,26 @@
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml bindings.
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
 
-@dataclass(slots=True)
+DEFAULT_MAX_DIFF_BYTES = 8192
+
+# `(absolute_path, st_mtime_ns, st_size)`: equal keys mean an unchanged file.
+ConfigFileKey = tuple[str, int, int]
+
+
+@dataclass(frozen=True, slots=True)
 class ConstraintConfig:
     """Word-count constraint bounds.
 
@@ -18,6 +30,7 @@ class ConstraintConfig:
 
     Output contract:
     - Immutable bound object used by engine and lab runners.
+    - `as_dict` is the validator-compatible mapping.
 
     Side effects:
     - None.
@@ -26,6 +39,12 @@ class ConstraintConfig:
     min: int
     max: int
 
+    @property
+    def as_dict(self) -> dict[str, int]:
+        """Return the bounds as a fresh validator mapping; callers read it once per run."""
+
+        return {"min": self.min, "max": self.max}
+
 
 @dataclass(slots=True)
 class FallbackConfig:
@@ -52,6 +71,8 @@ class ProdConfig:
 
     Input contract:
     - Fields must come from `config/prod.yaml`.
+    - `hedge_delay_seconds` opts into racing the fallback target against a
+      slow primary; `None` (the default) runs the fallback only on failure.
 
     Output contract:
     - Single object passed to production engine execution.
@@ -67,6 +88,8 @@ class ProdConfig:
     constraints: ConstraintConfig
     max_retries: int
     timeout_seconds: int
+    hedge_delay_seconds: float | None = None
+    max_diff_bytes: int | None = DEFAULT_MAX_DIFF_BYTES
 
 
 @dataclass(slots=True)
@@ -128,11 +151,31 @@ class LabConfig:
     batch: LabBatchConfig
 
 
-def _load_yaml(path: Path) -> dict[str, Any]:
-    """Load one YAML object from disk.
+def _file_cache_key(path: Path) -> ConfigFileKey:
+    """Build a cache key that changes whenever the file changes.
 
     Input contract:
-    - `path` points to a YAML file containing a mapping at root.
+    - `path` points to an existing file.
+
+    Output contract:
+    - Returns `(absolute_path, st_mtime_ns, st_size)`.
+
+    Side effects:
+    - Stats the file on disk.
+    """
+
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {path}") from None
+    return os.path.abspath(path), stat.st_mtime_ns, stat.st_size
+
+
+def _load_yaml(path: str) -> dict[str, Any]:
+    """Parse one YAML file.
+
+    Input contract:
+    - `path` points to a YAML file with a mapping root.
 
     Output contract:
     - Returns root mapping as dictionary.
@@ -141,15 +184,29 @@ def _load_yaml(path: Path) -> dict[str, Any]:
     - Reads file contents from disk.
     """
 
-    if not path.exists():
-        raise FileNotFoundError(f"Config file not found: {path}")
-
-    payload = yaml.safe_load(path.read_text(encoding="utf-8"))
+    payload = yaml.load(Path(path).read_text(encoding="utf-8"), Loader=_YamlLoader)
     if not isinstance(payload, dict):
         raise ValueError(f"YAML root must be a mapping: {path}")
     return payload
 
 
+def clear_config_cache() -> None:
+    """Drop all memoized parsed config objects.
+
+    Input contract:
+    - None.
+
+    Output contract:
+    - No return value.
+
+    Side effects:
+    - Clears in-process loader caches.
+    """
+
+    _load_prod_config_cached.cache_clear()
+    _load_lab_config_cached.cache_clear()
+
+
 def _parse_constraint_config(raw: dict[str, Any]) -> ConstraintConfig:
     """Convert raw mapping into `ConstraintConfig`.
 
@@ -172,16 +229,51 @@ def load_prod_config(path: str = "config/prod.yaml") -> ProdConfig:
     Input contract:
     - `path` points to production YAML schema.
 
+    Output contract:
+    - Returns validated `ProdConfig` object, shared across calls until the
+      file changes; callers must not mutate it.
+
+    Side effects:
+    - Reads YAML file from disk on cache miss.
+    """
+
+    return _load_prod_config_cached(_file_cache_key(Path(path)))
+
+
+@lru_cache(maxsize=8)
+def _load_prod_config_cached(key: ConfigFileKey) -> ProdConfig:
+    """Load production config, memoized by path and file version.
+
+    Input contract:
+    - `key` comes from `_file_cache_key`; an edited file yields a new key.
+
+    Output contract:
+    - Returns validated `ProdConfig` object.
+
+    Side effects:
+    - Reads YAML from disk on cache miss.
+    """
+
+    return _parse_prod_config(_load_yaml(key[0]))
+
+
+def _parse_prod_config(payload: dict[str, Any]) -> ProdConfig:
+    """Convert raw production YAML mapping into `ProdConfig`.
+
+    Input contract:
+    - `payload` is the root mapping of `config/prod.yaml`.
+
     Output contract:
     - Returns validated `ProdConfig` object.
 
     Side effects:
-    - Reads YAML file from disk.
+    - None.
     """
 
-    payload = _load_yaml(Path(path))
     fallback_raw = payload["fallback"]
     constraints_raw = payload["constraints"]
+    hedge_delay_raw = payload.get("hedge_delay_seconds")
+    max_diff_bytes_raw = payload.get("max_diff_bytes", DEFAULT_MAX_DIFF_BYTES)
 
     if not isinstance(fallback_raw, dict) or not isinstance(constraints_raw, dict):
         raise ValueError("`fallback` and `constraints` sections must be mappings")
@@ -198,6 +290,10 @@ def load_prod_config(path: str = "config/prod.yaml") -> ProdConfig:
         constraints=_parse_constraint_config(constraints_raw),
         max_retries=int(payload["max_retries"]),
         timeout_seconds=int(payload["timeout_seconds"]),
+        hedge_delay_seconds=(
+            None if hedge_delay_raw is None else float(hedge_delay_raw)
+        ),
+        max_diff_bytes=None if max_diff_bytes_raw is None else int(max_diff_bytes_raw),
     )
 
 
@@ -207,14 +303,47 @@ def load_lab_config(path: str = "config/lab.yaml") -> LabConfig:
     Input contract:
     - `path` points to lab YAML schema.
 
+    Output contract:
+    - Returns validated `LabConfig` object, shared across calls until the
+      file changes; callers must not mutate it.
+
+    Side effects:
+    - Reads YAML file from disk on cache miss.
+    """
+
+    return _load_lab_config_cached(_file_cache_key(Path(path)))
+
+
+@lru_cache(maxsize=8)
+def _load_lab_config_cached(key: ConfigFileKey) -> LabConfig:
+    """Load lab config, memoized by path and file version.
+
+    Input contract:
+    - `key` comes from `_file_cache_key`; an edited file yields a new key.
+
+    Output contract:
+    - Returns validated `LabConfig` object.
+
+    Side effects:
+    - Reads YAML from disk on cache miss.
+    """
+
+    return _parse_lab_config(_load_yaml(key[0]))
+
+
+def _parse_lab_config(payload: dict[str, Any]) -> LabConfig:
+    """Convert raw lab YAML mapping into `LabConfig`.
+
+    Input contract:
+    - `payload` is the root mapping of `config/lab.yaml`.
+
     Output contract:
     - Returns validated `LabConfig` object.
 
     Side effects:
-    - Reads YAML file from disk.
+    - None.
     """
 
-    payload = _load_yaml(Path(path))
     single_raw = payload["single"]
     batch_raw = payload["batch"]
 
@@ -6,87 +6,176 @@ It must never modify diffs, stage files, or mutate repository state.
 
 from __future__ import annotations
 
+import codecs
 import subprocess
+from collections.abc import Iterator
 
 from core.logger import debug_log
 from core.types import DiffContext
 
 
-def _run_git_command(cmd: list[str]) -> str:
-    """Execute a git command and return stdout text.
+STAGED_DIFF_COMMAND = ["git", "diff", "--cached"]
+STATUS_COMMAND = ["git", "status", "--porcelain=v1", "-z"]
+RENAME_OR_COPY_CODES = frozenset(b"RC")
+GIT_READ_CHUNK_SIZE = 1 << 16
+
+StatusEntry = tuple[bytes, bytes, bytes | None]
+
+
+def _start_git(cmd: list[str]) -> subprocess.Popen[bytes]:
+    """Start a git command with its stdout piped back to this process.
 
     Input contract:
     - `cmd` must be a valid argument vector beginning with `git`.
 
     Output contract:
-    - Returns decoded stdout string, possibly empty.
+    - Returns the running process; stderr is discarded.
 
     Side effects:
     - Spawns subprocess.
     """
 
-    completed = subprocess.run(cmd, capture_output=True, text=True, check=False)
-    return completed.stdout.strip()
+    return subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
 
 
-def _get_staged_diff() -> str:
-    """Read staged unified diff text.
+def _iter_git_output(process: subprocess.Popen[bytes]) -> Iterator[bytes]:
+    """Stream stdout of a running git process in chunks.
 
     Input contract:
-    - None.
+    - `process` was started by `_start_git`.
 
     Output contract:
-    - Returns staged diff from `git diff --cached`.
+    - Yields non-empty stdout byte chunks of at most `GIT_READ_CHUNK_SIZE`.
 
     Side effects:
-    - Calls git subprocess.
+    - Waits for the process once stdout is exhausted.
     """
 
-    return _run_git_command(["git", "diff", "--cached"])
+    stdout = process.stdout
+    if stdout is None:
+        raise RuntimeError("git subprocess stdout is unavailable.")
+    try:
+        yield from iter(lambda: stdout.read(GIT_READ_CHUNK_SIZE), b"")
+    finally:
+        stdout.close()
+        process.wait()
 
 
-def _get_git_status() -> str:
-    """Read short-format git status.
+def _read_staged_state() -> tuple[str, bytes, int, int]:
+    """Stream staged diff and read porcelain status, counting diff stats on the fly.
 
     Input contract:
     - None.
 
     Output contract:
-    - Returns raw `git status --short` output.
+    - Returns `(diff, status, insertions, deletions)` where `diff` is decoded
+      `git diff --cached` text and `status` is raw
+      `git status --porcelain=v1 -z` bytes.
 
     Side effects:
-    - Calls git subprocess.
+    - Runs both git commands concurrently as subprocesses.
     """
 
-    return _run_git_command(["git", "status", "--short"])
+    # Status output is small; it waits in its pipe while the diff streams.
+    status_process = _start_git(STATUS_COMMAND)
+    decoder = codecs.getincrementaldecoder("utf-8")("replace")
+    diff_parts: list[str] = []
+    insertions = 0
+    deletions = 0
+    # Tail of the last chunk without a newline yet; a bytearray appends in
+    # place, and only each new chunk is searched, so long lines stay linear.
+    pending = bytearray()
+
+    for chunk in _iter_git_output(_start_git(STAGED_DIFF_COMMAND)):
+        diff_parts.append(decoder.decode(chunk))
+        # Only complete lines are counted so `+`/`-` prefixes are never split.
+        cut = chunk.rfind(b"\n") + 1
+        if not cut:
+            pending += chunk
+            continue
+        pending += chunk[:cut]
+        block_insertions, block_deletions = _count_diff_stats(pending)
+        insertions += block_insertions
+        deletions += block_deletions
+        pending = bytearray(chunk[cut:])
 
+    block_insertions, block_deletions = _count_diff_stats(pending)
+    diff_parts.append(decoder.decode(b"", final=True))
+    diff = "".join(diff_parts).strip()
+    status, _ = status_process.communicate()
+    return diff, status, insertions + block_insertions, deletions + block_deletions
 
-def _parse_changed_files(status_output: str) -> list[str]:
-    """Extract changed file paths from short status output.
+
+def _split_status_entries(status_output: bytes) -> list[StatusEntry]:
+    """Split NUL-delimited porcelain status into entries.
 
     Input contract:
-    - `status_output` must follow `git status --short` line format.
+    - `status_output` must be raw `git status --porcelain=v1 -z` output.
 
     Output contract:
-    - Returns list of file path strings.
+    - Returns `(code, path, original_path)` tuples; `original_path` is set
+      only for entries renamed or copied in the index or the worktree.
 
     Side effects:
     - None.
     """
 
-    files: list[str] = []
-    for line in status_output.splitlines():
-        if len(line) < 4:
+    entries: list[StatusEntry] = []
+    fields = iter(status_output.split(b"\x00"))
+    for field in fields:
+        if len(field) < 4:
             continue
-        files.append(line[3:].strip())
-    return files
+        code = field[:2]
+        renamed = field[0] in RENAME_OR_COPY_CODES or field[1] in RENAME_OR_COPY_CODES
+        original = next(fields, None) if renamed else None
+        entries.append((code, field[3:], original))
+    return entries
+
 
+def _parse_changed_files(entries: list[StatusEntry]) -> list[str]:
+    """Extract changed file paths from parsed porcelain status entries.
+
+    Input contract:
+    - `entries` come from `_split_status_entries`.
+
+    Output contract:
+    - Returns list of file path strings; rename/copy entries yield the new path.
+
+    Side effects:
+    - None.
+    """
 
-def _count_diff_stats(diff: str) -> tuple[int, int]:
+    return [
+        path.decode("utf-8", "surrogateescape")
+        for _, path, _ in entries
+    ]
+
+
+def _format_status(entries: list[StatusEntry]) -> str:
+    """Render parsed porcelain status in `git status --short` line format.
+
+    Input contract:
+    - `entries` come from `_split_status_entries`.
+
+    Output contract:
+    - Returns newline-separated `XY path` lines, `XY old -> new` for renames.
+
+    Side effects:
+    - None.
+    """
+
+    lines: list[str] = []
+    for code, path, original in entries:
+        target = path if original is None else original + b" -> " + path
+        lines.append((code + b" " + target).decode("utf-8", "replace"))
+    return "\n".join(lines)
+
+
+def _count_diff_stats(diff: bytes | bytearray) -> tuple[int, int]:
     """Count insertion/deletion lines in a unified diff.
 
     Input contract:
-    - `diff` is unified diff text.
+    - `diff` is unified diff bytes (or bytearray) starting at a line boundary.
 
     Output contract:
     - Returns `(insertions, deletions)` as non-negative integers.
@@ -95,15 +184,12 @@ def _count_diff_stats(diff: str) -> tuple[int, int]:
     - None.
     """
 
-    insertions = 0
-    deletions = 0
-    for line in diff.splitlines():
-        if line.startswith("+++") or line.startswith("---"):
-            continue
-        if line.startswith("+"):
-            insertions += 1
-        elif line.startswith("-"):
-            deletions += 1
+    # Count line prefixes with C-level substring scans instead of a Python loop;
+    # `+++`/`---` file headers are subtracted back out.
+    insertions = diff.count(b"\n+") + diff.startswith(b"+")
+    insertions -= diff.count(b"\n+++") + diff.startswith(b"+++")
+    deletions = diff.count(b"\n-") + diff.startswith(b"-")
+    deletions -= diff.count(b"\n---") + diff.startswith(b"---")
     return insertions, deletions
 
 
@@ -121,10 +207,10 @@ def read_git_context(debug: bool = False) -> DiffContext:
     - Emits debug logs when `debug=True`.
     """
 
-    diff = _get_staged_diff()
-    status = _get_git_status()
-    files_changed = _parse_changed_files(status)
-    insertions, deletions = _count_diff_stats(diff)
+    diff, status_output, insertions, deletions = _read_staged_state()
+    entries = _split_status_entries(status_output)
+    status = _format_status(entries)
+    files_changed = _parse_changed_files(entries)
 
     context = DiffContext(
         diff=diff,
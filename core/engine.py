@@ -7,31 +7,70 @@ without performing any config parsing.
 
 from __future__ import annotations
 
+import asyncio
+import random
+import threading
 import time
-from typing import Any
-
-from config.loader import ConstraintConfig, ProdConfig
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
+from typing import Any, Callable
+
+from config.loader import (
+    DEFAULT_MAX_DIFF_BYTES,
+    LabSingleConfig,
+    ProdConfig,
+)
 from core.analyzer import read_git_context
-from core.generator import generate_commit
+from core.generator import (
+    generate_commit,
+    generate_commits,
+    generate_commits_async,
+    try_build_prompt,
+)
 from core.logger import debug_log, info_log
-from core.types import DiffContext, EngineResult
+from core.types import DiffContext, EngineResult, GeneratorOutput
 from core.validator import validate_commit
+from providers.groq_provider import api_key_configured as groq_key_configured
+
+# Receives one finished group's target indices and aligned results.
+GroupCallback = Callable[[list[int], list[EngineResult]], None]
+
+RETRY_BASE_DELAY_SECONDS = 0.5
+RETRY_MAX_DELAY_SECONDS = 8.0
+
+
+def _should_retry(generated: GeneratorOutput) -> bool:
+    """Decide whether a failed attempt is worth another one.
+
+    Input contract:
+    - `generated` is a generator result without a commit.
+
+    Output contract:
+    - Returns `False` only for provider errors marked non-retryable (auth,
+      TLS, bad request, missing API key); output-quality failures are retried.
+
+    Side effects:
+    - None.
+    """
+
+    return generated.error != "provider_error" or bool(generated.meta.get("retryable"))
 
 
-def _constraints_to_dict(constraints: ConstraintConfig) -> dict[str, int]:
-    """Convert typed constraints into validator mapping.
+def _backoff_delay(retries: int) -> float:
+    """Pick the pause before the next attempt after a transient provider error.
 
     Input contract:
-    - `constraints` is a `ConstraintConfig` dataclass.
+    - `retries` is the zero-based index of the attempt that just failed.
 
     Output contract:
-    - Returns dictionary with `min` and `max` integer bounds.
+    - Returns an exponential delay in seconds with full jitter, capped at
+      `RETRY_MAX_DELAY_SECONDS`.
 
     Side effects:
     - None.
     """
 
-    return {"min": constraints.min, "max": constraints.max}
+    delay = min(RETRY_MAX_DELAY_SECONDS, RETRY_BASE_DELAY_SECONDS * (2**retries))
+    return random.uniform(0.0, delay)
 
 
 def _run_target(
@@ -43,6 +82,9 @@ def _run_target(
     constraints: dict[str, Any],
     max_retries: int,
     debug: bool,
+    max_diff_bytes: int | None = None,
+    timeout_seconds: float | None = None,
+    cancel: threading.Event | None = None,
 ) -> EngineResult:
     """Run one configured provider/model/strategy target with retries.
 
@@ -51,21 +93,34 @@ def _run_target(
     - `strategy`, `provider`, `model` identify a concrete generation target.
     - `constraints` is validator-compatible bounds mapping.
     - `max_retries` is a non-negative retry cap.
+    - `max_diff_bytes` optionally caps the diff embedded in prompts.
+    - `timeout_seconds` is the provider HTTP timeout; `None` keeps the
+      provider default.
+    - `cancel`, once set, stops further attempts and abandons a streaming
+      generation in flight.
 
     Output contract:
-    - Returns `EngineResult` for this target only.
+    - Returns `EngineResult` for this target only; `error="cancelled"` when
+      cancelled before any attempt finished.
 
     Side effects:
-    - Calls generator/provider and validator repeatedly until success/exhaustion.
+    - Renders the prompt once and reuses it across retries.
+    - Calls generator/provider and validator repeatedly until success,
+      exhaustion, or a non-retryable provider error; backs off after
+      transient provider errors. This loop is the only retry layer.
     """
 
     started_at = time.perf_counter()
     retries = 0
     last_error: str | None = None
-    last_violations: list[str] = []
+    last_violations: tuple[str, ...] = ()
     last_meta: dict[str, Any] = {}
+    prompt = try_build_prompt(strategy, context, intent, constraints, max_diff_bytes)
 
     while retries <= max_retries:
+        if cancel is not None and cancel.is_set():
+            last_error = last_error or "cancelled"
+            break
         generated = generate_commit(
             context=context,
             prompt_strategy=strategy,
@@ -75,11 +130,20 @@ def _run_target(
             constraints=constraints,
             feedback=None,
             debug=debug,
+            max_diff_bytes=max_diff_bytes,
+            prebuilt_prompt=prompt,
+            timeout_seconds=timeout_seconds,
+            attempt=retries,
+            cancel=cancel,
         )
 
         if generated.commit is None:
             last_error = generated.error or "unknown"
             last_meta = generated.meta
+            if not _should_retry(generated):
+                break
+            if generated.error == "provider_error" and retries < max_retries:
+                time.sleep(_backoff_delay(retries))
         else:
             validation = validate_commit(generated.commit, constraints)
             generated.commit.word_count = validation.word_count
@@ -98,7 +162,7 @@ def _run_target(
                         **generated.meta,
                     },
                 )
-            last_violations = list(validation.violations)
+            last_violations = validation.violations
             last_error = "validation_failed"
 
         retries += 1
@@ -109,14 +173,580 @@ def _run_target(
     latency_ms = int((time.perf_counter() - started_at) * 1000)
     return EngineResult(
         commit=None,
-        violations=last_violations,
-        retries=max_retries,
+        violations=list(last_violations),
+        retries=min(retries, max_retries),
         latency_ms=latency_ms,
         error=last_error,
         meta=meta,
     )
 
 
+class _GroupRun:
+    """Per-target bookkeeping for one provider/model group across retry rounds.
+
+    Input contract:
+    - `provider` and `model` identify the shared generation backend.
+    - `targets` lists `(strategy, constraints)` pairs.
+    - `max_retries` is a non-negative retry cap applied per target.
+
+    Output contract:
+    - `pending_round` names the targets to send next; `record` consumes that
+      round's outputs; `finish` returns one `EngineResult` per target.
+
+    Side effects:
+    - Validates generated commits as rounds are recorded.
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        model: str,
+        targets: list[tuple[str, dict[str, Any]]],
+        max_retries: int,
+    ) -> None:
+        """Initialize bookkeeping with every target pending.
+
+        Input contract:
+        - Arguments as described on the class.
+
+        Output contract:
+        - Ready-to-use `_GroupRun` instance.
+
+        Side effects:
+        - Starts the group latency clock.
+        """
+
+        self.provider = provider
+        self.model = model
+        self.targets = targets
+        self.max_retries = max_retries
+        self.retries = 0
+        self.started_at = time.perf_counter()
+        self.pending = list(range(len(targets)))
+        self.stopped: list[int] = []
+        self.results: list[EngineResult | None] = [None] * len(targets)
+        self.last_errors: list[str | None] = [None] * len(targets)
+        self.last_violations: list[tuple[str, ...]] = [() for _ in targets]
+        self.last_metas: list[dict[str, Any]] = [{} for _ in targets]
+        self.final_retries = [max_retries] * len(targets)
+
+    def pending_round(self) -> list[int]:
+        """Return target indices to send this round; empty once the group is done."""
+
+        return self.pending if self.retries <= self.max_retries else []
+
+    def record(self, outputs: list[GeneratorOutput]) -> float:
+        """Consume one round's outputs, aligned with `pending_round()`.
+
+        Input contract:
+        - `outputs` holds one generator result per pending target.
+
+        Output contract:
+        - Returns the backoff delay in seconds before the next round; `0.0`
+          unless a pending target hit a transient provider error.
+
+        Side effects:
+        - Validates commits and advances the retry round.
+        """
+
+        still_pending: list[int] = []
+        transient_failure = False
+        for index, generated in zip(self.pending, outputs, strict=True):
+            strategy, constraints = self.targets[index]
+            if generated.commit is None:
+                self.last_errors[index] = generated.error or "unknown"
+                self.last_metas[index] = generated.meta
+                if not _should_retry(generated):
+                    self.final_retries[index] = self.retries
+                    self.stopped.append(index)
+                    continue
+                transient_failure = transient_failure or generated.error == "provider_error"
+            else:
+                validation = validate_commit(generated.commit, constraints)
+                generated.commit.word_count = validation.word_count
+                if not validation.violations:
+                    self.results[index] = EngineResult(
+                        commit=generated.commit,
+                        violations=[],
+                        retries=self.retries,
+                        latency_ms=int((time.perf_counter() - self.started_at) * 1000),
+                        error=None,
+                        meta={
+                            "provider": self.provider,
+                            "model": self.model,
+                            "strategy": strategy,
+                            **generated.meta,
+                        },
+                    )
+                    continue
+                self.last_violations[index] = validation.violations
+                self.last_errors[index] = "validation_failed"
+            still_pending.append(index)
+
+        self.pending = still_pending
+        delay = 0.0
+        if still_pending and transient_failure and self.retries < self.max_retries:
+            delay = _backoff_delay(self.retries)
+        self.retries += 1
+        return delay
+
+    def finish(self) -> list[EngineResult]:
+        """Return one `EngineResult` per target, failures carrying their last error."""
+
+        latency_ms = int((time.perf_counter() - self.started_at) * 1000)
+        for index in self.pending + self.stopped:
+            meta: dict[str, Any] = {
+                "provider": self.provider,
+                "model": self.model,
+                "strategy": self.targets[index][0],
+            }
+            meta.update(self.last_metas[index])
+            self.results[index] = EngineResult(
+                commit=None,
+                violations=list(self.last_violations[index]),
+                retries=self.final_retries[index],
+                latency_ms=latency_ms,
+                error=self.last_errors[index],
+                meta=meta,
+            )
+        return _require_results(self.results)
+
+
+def _run_group(
+    context: DiffContext,
+    provider: str,
+    model: str,
+    targets: list[tuple[str, dict[str, Any]]],
+    intent: str | None,
+    max_retries: int,
+    debug: bool,
+    max_diff_bytes: int | None = None,
+    use_batch_api: bool = True,
+    prompts: list[str | None] | None = None,
+    timeout_seconds: float | None = None,
+) -> list[EngineResult]:
+    """Run several strategy/constraint targets sharing one provider/model in batches.
+
+    Input contract:
+    - `context` is preloaded diff context.
+    - `provider` and `model` identify the shared generation backend.
+    - `targets` lists `(strategy, constraints)` pairs.
+    - `max_retries` is a non-negative retry cap applied per target.
+    - `max_diff_bytes` optionally caps the diff embedded in prompts.
+    - `use_batch_api` selects the provider's native batch API when available.
+    - `prompts` optionally holds prebuilt prompts aligned with `targets`.
+    - `timeout_seconds` is the per-request provider HTTP timeout.
+
+    Output contract:
+    - Returns one `EngineResult` per target, in input order.
+
+    Side effects:
+    - Calls batched generator/provider once per retry round for pending
+      targets; targets with a non-retryable provider error leave the batch,
+      and a round with transient provider errors is followed by a backoff.
+    """
+
+    run = _GroupRun(provider, model, targets, max_retries)
+    while pending := run.pending_round():
+        outputs = generate_commits(
+            context=context,
+            targets=[targets[index] for index in pending],
+            provider_name=provider,
+            model=model,
+            intent=intent,
+            debug=debug,
+            max_diff_bytes=max_diff_bytes,
+            use_batch_api=use_batch_api,
+            prebuilt_prompts=[prompts[index] for index in pending] if prompts else None,
+            timeout_seconds=timeout_seconds,
+            attempt=run.retries,
+        )
+        delay = run.record(outputs)
+        if delay:
+            time.sleep(delay)
+    return run.finish()
+
+
+async def _run_group_async(
+    context: DiffContext,
+    provider: str,
+    model: str,
+    targets: list[tuple[str, dict[str, Any]]],
+    intent: str | None,
+    max_retries: int,
+    debug: bool,
+    max_diff_bytes: int | None = None,
+    use_batch_api: bool = True,
+    prompts: list[str | None] | None = None,
+    timeout_seconds: float | None = None,
+) -> list[EngineResult]:
+    """Run one provider/model group like `_run_group`, awaiting provider calls.
+
+    Input contract:
+    - Same as `_run_group`.
+
+    Output contract:
+    - Same as `_run_group`.
+
+    Side effects:
+    - Same as `_run_group`; provider calls go through `generate_many` and
+      backoffs sleep without blocking the event loop.
+    """
+
+    run = _GroupRun(provider, model, targets, max_retries)
+    while pending := run.pending_round():
+        outputs = await generate_commits_async(
+            context=context,
+            targets=[targets[index] for index in pending],
+            provider_name=provider,
+            model=model,
+            intent=intent,
+            debug=debug,
+            max_diff_bytes=max_diff_bytes,
+            use_batch_api=use_batch_api,
+            prebuilt_prompts=[prompts[index] for index in pending] if prompts else None,
+            timeout_seconds=timeout_seconds,
+            attempt=run.retries,
+        )
+        delay = run.record(outputs)
+        if delay:
+            await asyncio.sleep(delay)
+    return run.finish()
+
+
+def run_matrix(
+    targets: list[LabSingleConfig],
+    context: DiffContext,
+    intent: str | None = None,
+    max_retries: int = 3,
+    debug: bool = False,
+    max_diff_bytes: int | None = DEFAULT_MAX_DIFF_BYTES,
+    max_workers: int = 8,
+    max_concurrency_per_provider: int = 2,
+    use_batch_api: bool = True,
+    timeout_seconds: float | None = None,
+    fallback_pass: bool = True,
+    on_group_done: GroupCallback | None = None,
+) -> list[EngineResult]:
+    """Run many lab targets, batching provider calls per provider/model pair.
+
+    Input contract:
+    - `targets` are concrete single-run configs, e.g. an expanded lab matrix.
+    - `context` is a diff context shared read-only by every target.
+    - `max_retries` is a non-negative retry cap applied per target.
+    - `max_diff_bytes` optionally caps the diff embedded in prompts.
+    - `max_workers` caps provider/model groups running concurrently.
+    - `max_concurrency_per_provider` caps concurrent groups per provider.
+    - `use_batch_api` selects providers' native batch APIs when available.
+    - `timeout_seconds` is the per-request provider HTTP timeout.
+    - `fallback_pass` reruns failed targets once more with a fresh retry
+      budget on the same provider/model. This matches `run_once` with the
+      fallback equal to the primary, which is how lab runs are configured.
+    - `on_group_done`, when given, receives each group's target indices and
+      results as soon as that group finishes.
+
+    Output contract:
+    - Returns one `EngineResult` per target, in input order, marked with
+      `fallback_used` (plus `primary_error`/`primary_retries` when used).
+
+    Side effects:
+    - Renders each distinct strategy/constraints prompt once for all targets.
+    - Calls provider-backed generation and validation once per
+      provider/model group and retry round, groups running on worker threads.
+    - Calls `on_group_done` from the calling thread, one group at a time.
+    """
+
+    groups, prompts = _plan_matrix(targets, context, intent, max_diff_bytes)
+    provider_slots = {
+        provider: threading.Semaphore(max_concurrency_per_provider) for provider, _ in groups
+    }
+
+    def run_pass(provider: str, model: str, indices: list[int]) -> list[EngineResult]:
+        return _run_group(
+            context=context,
+            provider=provider,
+            model=model,
+            targets=[
+                (targets[index].strategy, targets[index].constraints.as_dict) for index in indices
+            ],
+            intent=intent,
+            max_retries=max_retries,
+            debug=debug,
+            max_diff_bytes=max_diff_bytes,
+            use_batch_api=use_batch_api,
+            prompts=[prompts[index] for index in indices],
+            timeout_seconds=timeout_seconds,
+        )
+
+    def run_one_group(provider: str, model: str, indices: list[int]) -> list[EngineResult]:
+        with provider_slots[provider]:
+            results = run_pass(provider, model, indices)
+            for result in results:
+                result.meta["fallback_used"] = False
+            positions = _fallback_positions(results) if fallback_pass else []
+            if positions:
+                fallback = run_pass(provider, model, [indices[position] for position in positions])
+                _merge_fallback(results, positions, fallback)
+            return results
+
+    results: list[EngineResult | None] = [None] * len(targets)
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(groups)))) as executor:
+        futures = {
+            executor.submit(run_one_group, provider, model, indices): indices
+            for (provider, model), indices in groups.items()
+        }
+        for future in as_completed(futures):
+            indices = futures[future]
+            group_results = future.result()
+            for index, result in zip(indices, group_results, strict=True):
+                results[index] = result
+            if on_group_done is not None:
+                on_group_done(indices, group_results)
+
+    return _require_results(results)
+
+
+async def run_matrix_async(
+    targets: list[LabSingleConfig],
+    context: DiffContext,
+    intent: str | None = None,
+    max_retries: int = 3,
+    debug: bool = False,
+    max_diff_bytes: int | None = DEFAULT_MAX_DIFF_BYTES,
+    max_workers: int = 8,
+    max_concurrency_per_provider: int = 2,
+    use_batch_api: bool = True,
+    timeout_seconds: float | None = None,
+    fallback_pass: bool = True,
+    on_group_done: GroupCallback | None = None,
+) -> list[EngineResult]:
+    """Run many lab targets like `run_matrix`, as asyncio tasks.
+
+    Input contract:
+    - Same as `run_matrix`.
+
+    Output contract:
+    - Same as `run_matrix`.
+
+    Side effects:
+    - Same as `run_matrix`; each provider/model group is a task awaiting its
+      provider's `generate_many`, so no worker thread is held per group.
+    - Calls `on_group_done` on the event loop as each group finishes.
+    """
+
+    groups, prompts = _plan_matrix(targets, context, intent, max_diff_bytes)
+    group_slots = asyncio.Semaphore(max(1, max_workers))
+    provider_slots = {
+        provider: asyncio.Semaphore(max_concurrency_per_provider) for provider, _ in groups
+    }
+
+    async def run_pass(provider: str, model: str, indices: list[int]) -> list[EngineResult]:
+        return await _run_group_async(
+            context=context,
+            provider=provider,
+            model=model,
+            targets=[
+                (targets[index].strategy, targets[index].constraints.as_dict) for index in indices
+            ],
+            intent=intent,
+            max_retries=max_retries,
+            debug=debug,
+            max_diff_bytes=max_diff_bytes,
+            use_batch_api=use_batch_api,
+            prompts=[prompts[index] for index in indices],
+            timeout_seconds=timeout_seconds,
+        )
+
+    async def run_one_group(provider: str, model: str, indices: list[int]) -> list[EngineResult]:
+        async with group_slots, provider_slots[provider]:
+            results = await run_pass(provider, model, indices)
+            for result in results:
+                result.meta["fallback_used"] = False
+            positions = _fallback_positions(results) if fallback_pass else []
+            if positions:
+                fallback = await run_pass(
+                    provider, model, [indices[position] for position in positions]
+                )
+                _merge_fallback(results, positions, fallback)
+        if on_group_done is not None:
+            on_group_done(indices, results)
+        return results
+
+    group_results = await asyncio.gather(
+        *(run_one_group(provider, model, indices) for (provider, model), indices in groups.items())
+    )
+    results: list[EngineResult | None] = [None] * len(targets)
+    for indices, group in zip(groups.values(), group_results, strict=True):
+        for index, result in zip(indices, group, strict=True):
+            results[index] = result
+    return _require_results(results)
+
+
+def _plan_matrix(
+    targets: list[LabSingleConfig],
+    context: DiffContext,
+    intent: str | None,
+    max_diff_bytes: int | None,
+) -> tuple[dict[tuple[str, str], list[int]], list[str | None]]:
+    """Group lab targets by provider/model and render their prompts once.
+
+    Input contract:
+    - Same as the matching `run_matrix` arguments.
+
+    Output contract:
+    - Returns `(groups, prompts)`: target indices per `(provider, model)`, and
+      one prebuilt prompt per target (`None` where rendering failed).
+
+    Side effects:
+    - Renders each distinct strategy/constraints prompt once.
+    """
+
+    groups: dict[tuple[str, str], list[int]] = {}
+    prompt_by_key: dict[tuple[str, int, int], str | None] = {}
+    prompts: list[str | None] = []
+    for index, target in enumerate(targets):
+        groups.setdefault((target.provider, target.model), []).append(index)
+        key = (target.strategy, target.constraints.min, target.constraints.max)
+        if key not in prompt_by_key:
+            prompt_by_key[key] = try_build_prompt(
+                target.strategy, context, intent, target.constraints.as_dict, max_diff_bytes
+            )
+        prompts.append(prompt_by_key[key])
+    return groups, prompts
+
+
+def _require_results(results: list[EngineResult | None]) -> list[EngineResult]:
+    """Return positional results, refusing to drop a missing slot.
+
+    Input contract:
+    - `results` holds one slot per target, all filled by the caller.
+
+    Output contract:
+    - Returns the same results, index-aligned with the targets.
+    - Raises `RuntimeError` if any slot is empty, instead of returning a
+      shorter list that would misalign callers.
+
+    Side effects:
+    - None.
+    """
+
+    filled = [result for result in results if result is not None]
+    if len(filled) != len(results):
+        raise RuntimeError("Batch targets finished without results.")
+    return filled
+
+
+def _missing_groq_key(result: EngineResult) -> bool:
+    """Report whether a failed result stems from an unset `GROQ_API_KEY`.
+
+    Input contract:
+    - `result` is a finished target result.
+
+    Output contract:
+    - Returns `True` when a fallback attempt cannot help because the Groq
+      API key is missing.
+
+    Side effects:
+    - None.
+    """
+
+    return result.error == "provider_error" and "GROQ_API_KEY" in result.meta.get("reason", "")
+
+
+def _hedge_blocked_by_groq_key(config: ProdConfig) -> bool:
+    """Report whether either production target is Groq without an API key.
+
+    Input contract:
+    - `config` is a fully-loaded `ProdConfig` object.
+
+    Output contract:
+    - Returns `True` when hedging would start a target that can only fail
+      on the missing `GROQ_API_KEY`, so `run_once` should run sequentially
+      and keep its missing-key short-circuit.
+
+    Side effects:
+    - None.
+    """
+
+    providers = (config.provider, config.fallback.provider)
+    return "groq" in providers and not groq_key_configured()
+
+
+def _fallback_positions(results: list[EngineResult]) -> list[int]:
+    """Return positions of failed results that get a fallback pass.
+
+    Input contract:
+    - `results` are primary-pass results of one provider/model group.
+
+    Output contract:
+    - Returns positions without a commit, except missing-API-key failures,
+      which `run_once` also returns without a fallback.
+
+    Side effects:
+    - None.
+    """
+
+    return [
+        position
+        for position, result in enumerate(results)
+        if result.commit is None and not _missing_groq_key(result)
+    ]
+
+
+def _merge_fallback(
+    results: list[EngineResult], positions: list[int], fallback: list[EngineResult]
+) -> None:
+    """Replace failed primary results with their fallback-pass results.
+
+    Input contract:
+    - `results` are primary-pass results already marked `fallback_used=False`.
+    - `fallback` is aligned with `positions`.
+
+    Output contract:
+    - No return value.
+
+    Side effects:
+    - Mutates `results` and the fallback results' `meta` the way `run_once`
+      marks a fallback result.
+    """
+
+    for position, result in zip(positions, fallback, strict=True):
+        primary = results[position]
+        result.meta["fallback_used"] = True
+        result.meta["primary_error"] = primary.error
+        result.meta["primary_retries"] = primary.retries
+        results[position] = result
+
+
+def _mark_result(
+    result: EngineResult,
+    config: ProdConfig,
+    fallback_used: bool,
+    hedged: bool,
+    primary: EngineResult | None = None,
+) -> EngineResult:
+    """Attach run-level telemetry to a target result.
+
+    Input contract:
+    - `result` comes from `_run_target`.
+    - `primary` is the finished primary result when `result` is the fallback.
+
+    Output contract:
+    - Returns the same `EngineResult`, with `meta` updated in place.
+
+    Side effects:
+    - Mutates `result.meta`.
+    """
+
+    result.meta["timeout_seconds"] = config.timeout_seconds
+    result.meta["fallback_used"] = fallback_used
+    result.meta["hedged"] = hedged
+    if primary is not None:
+        result.meta["primary_error"] = primary.error
+        result.meta["primary_retries"] = primary.retries
+    return result
+
+
 def run_once(config: ProdConfig, intent: str | None = None, debug: bool = False) -> EngineResult:
     """Run production generation with automatic fallback target handling.
 
@@ -131,29 +761,71 @@ def run_once(config: ProdConfig, intent: str | None = None, debug: bool = False)
     Side effects:
     - Reads git context once.
     - Calls provider-backed generation and validation.
+    - Only when `config.hedge_delay_seconds` is set (hedging is opt-in):
+      starts the fallback target concurrently if the primary has not
+      finished within that delay, and cancels the slower target once a
+      valid commit is available. Hedging is skipped when either target is
+      Groq without `GROQ_API_KEY`.
     """
 
-    constraints = _constraints_to_dict(config.constraints)
+    constraints = config.constraints.as_dict
+    primary_cancel = threading.Event()
+    fallback_cancel = threading.Event()
     info_log("Reading git context...", color="cyan")
     context = read_git_context(debug=debug)
 
+    def run_primary() -> EngineResult:
+        return _run_target(
+            context=context,
+            strategy=config.strategy,
+            provider=config.provider,
+            model=config.model,
+            intent=intent,
+            constraints=constraints,
+            max_retries=config.max_retries,
+            debug=debug,
+            max_diff_bytes=config.max_diff_bytes,
+            timeout_seconds=config.timeout_seconds,
+            cancel=primary_cancel,
+        )
+
+    def run_fallback() -> EngineResult:
+        return _run_target(
+            context=context,
+            strategy=config.fallback.strategy,
+            provider=config.fallback.provider,
+            model=config.fallback.model,
+            intent=intent,
+            constraints=constraints,
+            max_retries=config.max_retries,
+            debug=debug,
+            max_diff_bytes=config.max_diff_bytes,
+            timeout_seconds=config.timeout_seconds,
+            cancel=fallback_cancel,
+        )
+
     info_log(
         "Calling primary provider...",
         payload={"provider": config.provider, "model": config.model},
         color="cyan",
     )
-    primary = _run_target(
-        context=context,
-        strategy=config.strategy,
-        provider=config.provider,
-        model=config.model,
-        intent=intent,
-        constraints=constraints,
-        max_retries=config.max_retries,
-        debug=debug,
-    )
-    primary.meta["timeout_seconds"] = config.timeout_seconds
-    primary.meta["fallback_used"] = False
+    hedge = config.hedge_delay_seconds is not None
+    if hedge and _hedge_blocked_by_groq_key(config):
+        debug_log(debug, "hedge_skipped", {"reason": "GROQ_API_KEY is not set."})
+        hedge = False
+    if not hedge:
+        primary = _mark_result(run_primary(), config, fallback_used=False, hedged=False)
+    else:
+        primary_future = _start_daemon(run_primary)
+        wait([primary_future], timeout=config.hedge_delay_seconds)
+        if not primary_future.done():
+            try:
+                return _run_hedged(config, primary_future, run_fallback, debug)
+            finally:
+                # Whichever target lost stops retrying and drops its stream.
+                primary_cancel.set()
+                fallback_cancel.set()
+        primary = _mark_result(primary_future.result(), config, fallback_used=False, hedged=False)
 
     if primary.commit is not None:
         info_log("Commit generated successfully.", color="green")
@@ -161,9 +833,7 @@ def run_once(config: ProdConfig, intent: str | None = None, debug: bool = False)
 
     debug_log(debug, "primary_failed", {"error": primary.error, "meta": primary.meta})
 
-    if primary.error == "provider_error" and "GROQ_API_KEY" in primary.meta.get(
-        "reason", ""
-    ):
+    if _missing_groq_key(primary):
         info_log(
             "GROQ_API_KEY is not set. Please set the GROQ_API_KEY environment variable.",
             color="red",
@@ -176,20 +846,9 @@ def run_once(config: ProdConfig, intent: str | None = None, debug: bool = False)
         payload={"provider": config.fallback.provider, "model": config.fallback.model},
         color="yellow",
     )
-    fallback = _run_target(
-        context=context,
-        strategy=config.fallback.strategy,
-        provider=config.fallback.provider,
-        model=config.fallback.model,
-        intent=intent,
-        constraints=constraints,
-        max_retries=config.max_retries,
-        debug=debug,
+    fallback = _mark_result(
+        run_fallback(), config, fallback_used=True, hedged=False, primary=primary
     )
-    fallback.meta["timeout_seconds"] = config.timeout_seconds
-    fallback.meta["fallback_used"] = True
-    fallback.meta["primary_error"] = primary.error
-    fallback.meta["primary_retries"] = primary.retries
 
     if fallback.commit is not None:
         info_log("Commit generated successfully with fallback provider.", color="green")
@@ -197,3 +856,82 @@ def run_once(config: ProdConfig, intent: str | None = None, debug: bool = False)
         info_log("Fallback provider also failed.", color="red")
 
     return fallback
+
+
+def _start_daemon(fn: Callable[[], EngineResult]) -> Future[EngineResult]:
+    """Run one target on a daemon thread and expose its outcome as a future.
+
+    Input contract:
+    - `fn` runs a target to completion.
+
+    Output contract:
+    - Returns a running `Future` resolved with `fn`'s result or exception.
+
+    Side effects:
+    - Starts a daemon thread, so a cancelled target that is still waiting
+      on its provider never delays interpreter exit.
+    """
+
+    future: Future[EngineResult] = Future()
+    future.set_running_or_notify_cancel()
+
+    def run() -> None:
+        try:
+            future.set_result(fn())
+        except BaseException as exc:  # noqa: BLE001
+            future.set_exception(exc)
+
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
+
+def _run_hedged(
+    config: ProdConfig,
+    primary_future: Future[EngineResult],
+    run_fallback: Callable[[], EngineResult],
+    debug: bool,
+) -> EngineResult:
+    """Race a slow primary target against the fallback target.
+
+    Input contract:
+    - `primary_future` is the still-running primary target.
+    - `run_fallback` runs the fallback target synchronously.
+
+    Output contract:
+    - Returns the first valid result, else the fallback failure result.
+
+    Side effects:
+    - Starts the fallback target on a daemon thread.
+    - Emits info/debug logs.
+    """
+
+    info_log(
+        "Primary provider is slow. Hedging with fallback provider...",
+        payload={
+            "provider": config.fallback.provider,
+            "model": config.fallback.model,
+            "hedge_delay_seconds": config.hedge_delay_seconds,
+        },
+        color="yellow",
+    )
+    fallback_future = _start_daemon(run_fallback)
+    primary: EngineResult | None = None
+    fallback: EngineResult | None = None
+
+    for finished in as_completed([primary_future, fallback_future]):
+        if finished is primary_future:
+            primary = _mark_result(finished.result(), config, fallback_used=False, hedged=True)
+            if primary.commit is not None:
+                info_log("Commit generated successfully.", color="green")
+                return primary
+            debug_log(debug, "primary_failed", {"error": primary.error, "meta": primary.meta})
+        else:
+            fallback = _mark_result(finished.result(), config, fallback_used=True, hedged=True)
+            if fallback.commit is not None:
+                info_log("Commit generated successfully with fallback provider.", color="green")
+                return fallback
+
+    info_log("Fallback provider also failed.", color="red")
+    if fallback is None or primary is None:
+        raise RuntimeError("Hedged targets finished without results.")
+    return _mark_result(fallback, config, fallback_used=True, hedged=True, primary=primary)
@@ -6,16 +6,34 @@ policy/rule constraints; validation belongs to `core.validator`.
 
 from __future__ import annotations
 
-import json
-import re
+import asyncio
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from string import Formatter
+from typing import Any, AnyStr
 
+from core import jsonio
 from core.logger import debug_log
 from core.types import CommitMessage, DiffContext, GeneratorOutput
-from providers.registry import PROVIDERS
+from providers.cache import CacheKey, response_cache_key
+from providers.registry import PROVIDERS, RESPONSE_CACHE
+from providers.transport import is_transient_error
 
+_TRUNCATION_MARKER = "\n... [truncated {} hunks] ...\n"
+BATCH_FALLBACK_WORKERS = 8
 
+# Fans out single calls for providers without a native batch API; shared so
+# batches reuse its threads instead of starting a pool per call.
+_BATCH_EXECUTOR = ThreadPoolExecutor(
+    max_workers=BATCH_FALLBACK_WORKERS, thread_name_prefix="provider-batch"
+)
+
+
+@lru_cache(maxsize=None)
 def load_prompt(strategy: str) -> str:
     """Load a prompt template by strategy name.
 
@@ -23,10 +41,10 @@ def load_prompt(strategy: str) -> str:
     - `strategy` maps to `<prompt_dir>/<strategy>.txt`.
 
     Output contract:
-    - Returns template text.
+    - Returns template text; templates are read once per process.
 
     Side effects:
-    - Reads a file from disk.
+    - Reads a file from disk on first use of each strategy.
     """
 
     prompt_dir = Path("prompts")
@@ -40,54 +58,540 @@ def load_prompt(strategy: str) -> str:
     raise FileNotFoundError(f"Prompt strategy file not found for: {strategy}")
 
 
+@dataclass(slots=True, frozen=True)
+class PromptTemplate:
+    """Prompt template pre-split into literal segments and placeholder names.
+
+    Input contract:
+    - `literals` has exactly one more item than `fields`.
+    - `fields` lists `str.format`-style placeholder names in order.
+
+    Output contract:
+    - `render`/`render_parts` interleave literals with field values without
+      re-parsing.
+
+    Side effects:
+    - None.
+    """
+
+    literals: tuple[str, ...]
+    fields: tuple[str, ...]
+
+    def render_parts(self, values: dict[str, str]) -> list[str]:
+        """Return literal and value segments in order, ready to join."""
+
+        parts = [self.literals[0]]
+        for field_name, literal in zip(self.fields, self.literals[1:]):
+            parts.append(values.get(field_name, ""))
+            parts.append(literal)
+        return parts
+
+    def render(self, values: dict[str, str]) -> str:
+        """Fill placeholders from `values`; missing fields render empty."""
+
+        return "".join(self.render_parts(values))
+
+
+def compile_prompt_template(text: str) -> PromptTemplate:
+    """Parse `str.format`-style template text once into a `PromptTemplate`.
+
+    Input contract:
+    - `text` uses `{name}` placeholders and `{{`/`}}` escapes.
+
+    Output contract:
+    - Returns `PromptTemplate`; format specs and conversions are ignored.
+
+    Side effects:
+    - None.
+    """
+
+    literals: list[str] = []
+    fields: list[str] = []
+    pending = ""
+    for literal, field_name, _, _ in Formatter().parse(text):
+        pending += literal
+        if field_name is not None:
+            literals.append(pending)
+            fields.append(field_name)
+            pending = ""
+    literals.append(pending)
+    return PromptTemplate(literals=tuple(literals), fields=tuple(fields))
+
+
+@lru_cache(maxsize=None)
+def load_prompt_template(strategy: str) -> PromptTemplate:
+    """Load and compile a prompt template by strategy name.
+
+    Input contract:
+    - `strategy` maps to `<prompt_dir>/<strategy>.txt`.
+
+    Output contract:
+    - Returns compiled `PromptTemplate`; compiled once per process.
+
+    Side effects:
+    - Reads a file from disk on first use of each strategy.
+    """
+
+    return compile_prompt_template(load_prompt(strategy))
+
+
+def _clear_prompt_cache() -> None:
+    """Drop cached prompt texts and compiled templates.
+
+    Input contract:
+    - None.
+
+    Output contract:
+    - No return value.
+
+    Side effects:
+    - Clears `load_prompt` and `load_prompt_template` caches.
+    """
+
+    load_prompt.cache_clear()
+    load_prompt_template.cache_clear()
+
+
+def _trim_diff(diff: str, max_bytes: int) -> str:
+    """Trim a unified diff to a UTF-8 byte budget, keeping its head and tail.
+
+    Input contract:
+    - `diff` is unified diff text.
+    - `max_bytes` is a positive byte budget.
+
+    Output contract:
+    - Returns `diff` unchanged when within budget; otherwise its head and tail
+      cut at `diff --git` (else line) boundaries and joined by a truncation
+      marker, at most `max_bytes` bytes in total.
+
+    Side effects:
+    - None.
+    """
+
+    # ASCII text has one byte per character, so it is measured and cut as-is
+    # without an encode/decode round trip; only non-ASCII diffs are encoded.
+    # The marker is ASCII and its hunk count cannot exceed the diff's total, so
+    # reserving that widest form keeps head + marker + tail within budget.
+    if diff.isascii():
+        if len(diff) <= max_bytes:
+            return diff
+        budget = max_bytes - len(_TRUNCATION_MARKER.format(diff.count("\n@@")))
+        if budget <= 0:
+            return _TRUNCATION_MARKER.format(diff.count("\n@@"))[:max_bytes]
+        head, omitted_hunks, tail = _split_diff(diff, budget, "\ndiff --git", "\n", "\n@@")
+    else:
+        encoded = diff.encode("utf-8")
+        if len(encoded) <= max_bytes:
+            return diff
+        budget = max_bytes - len(_TRUNCATION_MARKER.format(encoded.count(b"\n@@")))
+        if budget <= 0:
+            return _TRUNCATION_MARKER.format(encoded.count(b"\n@@"))[:max_bytes]
+        head_bytes, omitted_hunks, tail_bytes = _split_diff(
+            encoded, budget, b"\ndiff --git", b"\n", b"\n@@"
+        )
+        head = head_bytes.decode("utf-8", "ignore")
+        tail = tail_bytes.decode("utf-8", "ignore")
+    return f"{head}{_TRUNCATION_MARKER.format(omitted_hunks)}{tail}"
+
+
+def _split_diff(
+    text: AnyStr,
+    max_units: int,
+    file_marker: AnyStr,
+    newline: AnyStr,
+    hunk_marker: AnyStr,
+) -> tuple[AnyStr, int, AnyStr]:
+    """Cut a diff into head/tail halves at file (else line) boundaries.
+
+    Input contract:
+    - `text` is longer than `max_units`, measured in its own units.
+    - Marker arguments have the same type as `text`.
+
+    Output contract:
+    - Returns `(head, omitted_hunk_count, tail)`.
+
+    Side effects:
+    - None.
+    """
+
+    half = max_units // 2
+    head_end = text.rfind(file_marker, 0, half)
+    if head_end < 0:
+        head_end = text.rfind(newline, 0, half)
+    if head_end < 0:
+        head_end = half
+
+    tail_from = len(text) - half
+    tail_start = text.find(file_marker, tail_from)
+    if tail_start < 0:
+        tail_start = text.find(newline, tail_from)
+    if tail_start < 0:
+        tail_start = tail_from
+    tail_start = max(tail_start, head_end)
+
+    omitted_hunks = text.count(hunk_marker, head_end, tail_start)
+    return text[:head_end], omitted_hunks, text[tail_start:].lstrip(newline)
+
+
+def build_prompt_parts(
+    template: PromptTemplate,
+    context: DiffContext,
+    intent: str | None,
+    constraints: dict[str, Any] | None,
+    max_diff_bytes: int | None = None,
+    feedback: str | None = None,
+) -> list[str]:
+    """Compose provider prompt segments from template and diff context.
+
+    Input contract:
+    - Same as `build_prompt`.
+
+    Output contract:
+    - Returns prompt segments whose concatenation is the full prompt.
+      Templates without a `{diff}` placeholder get intent/constraints/status/
+      diff segments appended, and templates without `{feedback}` get feedback
+      segments appended; callers may append further segments before joining.
+
+    Side effects:
+    - None.
+    """
+
+    constraints = constraints or {}
+    diff = context.diff if max_diff_bytes is None else _trim_diff(context.diff, max_diff_bytes)
+    parts = template.render_parts(
+        {
+            "status": context.status,
+            "diff": diff,
+            "user_hint": intent or "",
+            "feedback": feedback or "",
+            "min_length": str(constraints.get("min", "")),
+            "max_length": str(constraints.get("max", "")),
+        }
+    )
+    if "diff" not in template.fields:
+        parts += (
+            "\n\nIntent: ",
+            intent or "",
+            "\nConstraints: ",
+            jsonio.dumps(constraints, sort_keys=True),
+            "\nStatus:\n",
+            context.status,
+            "\n\nDiff:\n",
+            diff,
+            "\n",
+        )
+    if feedback and "feedback" not in template.fields:
+        parts += ("\n\nFeedback:\n", feedback)
+    return parts
+
+
 def build_prompt(
-    template: str,
+    template: PromptTemplate,
     context: DiffContext,
     intent: str | None,
     constraints: dict[str, Any] | None,
+    max_diff_bytes: int | None = None,
+    feedback: str | None = None,
 ) -> str:
     """Compose provider prompt from template and diff context.
 
     Input contract:
-    - `template` is raw prompt template text.
+    - `template` is a compiled prompt template.
     - `context` contains diff/status metadata from analyzer.
-    - `intent` and `constraints` are optional guidance hints.
+    - `intent`, `constraints`, and `feedback` are optional guidance hints.
+    - `max_diff_bytes` optionally caps the embedded diff size.
 
     Output contract:
-    - Returns a fully formatted prompt string.
+    - Returns a fully formatted prompt string, joined once from
+      `build_prompt_parts`.
 
     Side effects:
     - None.
     """
 
-    constraints_text = json.dumps(constraints or {}, sort_keys=True)
-    return (
-        f"{template}\n\n"
-        f"Intent: {intent or ''}\n"
-        f"Constraints: {constraints_text}\n"
-        f"Status:\n{context.status}\n\n"
-        f"Diff:\n{context.diff}\n"
+    return "".join(
+        build_prompt_parts(template, context, intent, constraints, max_diff_bytes, feedback)
     )
 
 
-def call_provider(provider: str, model: str, prompt: str) -> str:
+def try_build_prompt(
+    strategy: str,
+    context: DiffContext,
+    intent: str | None,
+    constraints: dict[str, Any] | None,
+    max_diff_bytes: int | None = None,
+) -> str | None:
+    """Render a strategy's prompt ahead of generation, for reuse across calls.
+
+    Input contract:
+    - Same inputs as `build_prompt`, with `strategy` naming the template.
+
+    Output contract:
+    - Returns the rendered prompt, or `None` when the template cannot be
+      loaded or rendered so the generation call reports the error itself.
+
+    Side effects:
+    - Reads prompt templates.
+    """
+
+    try:
+        return build_prompt(
+            load_prompt_template(strategy), context, intent, constraints, max_diff_bytes
+        )
+    except Exception:  # noqa: BLE001
+        return None
+
+
+class GenerationCancelled(RuntimeError):
+    """Raised when a streamed generation is abandoned because a caller cancelled it."""
+
+
+def _collect_stream(fragments: Iterator[str], cancel: threading.Event) -> str:
+    """Join streamed response fragments, abandoning the stream once `cancel` is set.
+
+    Input contract:
+    - `fragments` is a provider `generate_stream` iterator.
+
+    Output contract:
+    - Returns the joined response text.
+    - Raises `GenerationCancelled` when `cancel` is set mid-stream.
+
+    Side effects:
+    - Closes the stream when done or cancelled, which closes its HTTP
+      response so the provider stops generating.
+    """
+
+    parts: list[str] = []
+    try:
+        for fragment in fragments:
+            if cancel.is_set():
+                raise GenerationCancelled("Generation cancelled.")
+            parts.append(fragment)
+    finally:
+        close = getattr(fragments, "close", None)
+        if close is not None:
+            close()
+    return "".join(parts)
+
+
+def call_provider(
+    provider: str,
+    model: str,
+    prompt: str,
+    timeout_seconds: float | None = None,
+    attempt: int = 0,
+    cancel: threading.Event | None = None,
+) -> str:
     """Call a registered provider to generate a raw model response.
 
     Input contract:
     - `provider` must exist in `providers.registry.PROVIDERS`.
     - `model` must be valid for the selected provider.
     - `prompt` is opaque text payload.
+    - `timeout_seconds` is the provider HTTP timeout; `None` keeps the
+      provider default.
+    - `attempt` is the engine retry index, part of the response cache key.
+    - `cancel`, when set mid-generation, abandons a streaming provider's
+      response; providers without `generate_stream` finish their request.
 
     Output contract:
-    - Returns raw response text from provider.
+    - Returns raw response text from provider or the response cache.
+    - Raises the provider error; retrying is left to the engine.
 
     Side effects:
-    - Performs network I/O via provider implementation.
+    - Performs one network request via provider implementation on cache miss.
+    - Stores successful responses in `RESPONSE_CACHE`.
     """
 
     if provider not in PROVIDERS:
         raise KeyError(f"Unknown provider: {provider}")
-    return PROVIDERS[provider]["generate"](prompt, model)
+    adapter = PROVIDERS[provider]
+
+    def fetch() -> str:
+        if cancel is not None and adapter.generate_stream is not None:
+            return _collect_stream(adapter.generate_stream(prompt, model, timeout_seconds), cancel)
+        return adapter.generate(prompt, model, timeout_seconds)
+
+    if not RESPONSE_CACHE.maxsize:
+        return fetch()
+
+    key = response_cache_key(provider, model, prompt, attempt)
+    raw = RESPONSE_CACHE.get(key)
+    if raw is None:
+        raw = fetch()
+        RESPONSE_CACHE.put(key, raw)
+    return raw
+
+
+def call_provider_batch(
+    provider: str,
+    model: str,
+    prompts: list[str],
+    use_batch_api: bool = True,
+    timeout_seconds: float | None = None,
+    attempt: int = 0,
+) -> list[str | Exception]:
+    """Call a registered provider for a batch of prompts.
+
+    Input contract:
+    - `provider` must exist in `providers.registry.PROVIDERS`.
+    - `model` must be valid for the selected provider.
+    - `prompts` are opaque text payloads.
+    - `use_batch_api` selects the provider's `generate_batch` when available.
+    - `timeout_seconds` is the per-request provider HTTP timeout; `None`
+      keeps the provider default.
+    - `attempt` is the engine retry index, part of the response cache key.
+
+    Output contract:
+    - Returns one entry per prompt, in order: the raw response text, or the
+      exception raised for that prompt. A failing prompt never drops or
+      shifts the other entries.
+
+    Side effects:
+    - Sends only prompts missing from `RESPONSE_CACHE` to the provider and
+      caches their successful responses.
+    - Performs network I/O via provider implementation; without a batch API,
+      up to `BATCH_FALLBACK_WORKERS` single `generate` calls run concurrently
+      on a shared thread pool.
+    """
+
+    if provider not in PROVIDERS:
+        raise KeyError(f"Unknown provider: {provider}")
+    keys, outcomes = _lookup_cached_batch(provider, model, prompts, attempt)
+    missing = [index for index, outcome in enumerate(outcomes) if outcome is None]
+    fetched = (
+        _generate_uncached_batch(
+            provider, model, [prompts[index] for index in missing], use_batch_api, timeout_seconds
+        )
+        if missing
+        else []
+    )
+    return _merge_fetched_batch(keys, outcomes, missing, fetched)
+
+
+async def call_provider_batch_async(
+    provider: str,
+    model: str,
+    prompts: list[str],
+    use_batch_api: bool = True,
+    timeout_seconds: float | None = None,
+    attempt: int = 0,
+) -> list[str | Exception]:
+    """Call a registered provider for a batch of prompts from asyncio code.
+
+    Input contract:
+    - Same as `call_provider_batch`.
+
+    Output contract:
+    - Same as `call_provider_batch`.
+
+    Side effects:
+    - Same caching as `call_provider_batch`.
+    - Awaits the provider's `generate_many` for prompts missing from the
+      cache; a native `generate_batch` runs on a worker thread instead.
+    """
+
+    if provider not in PROVIDERS:
+        raise KeyError(f"Unknown provider: {provider}")
+    keys, outcomes = _lookup_cached_batch(provider, model, prompts, attempt)
+    missing = [index for index, outcome in enumerate(outcomes) if outcome is None]
+    fetched: list[str | Exception] = []
+    if missing:
+        adapter = PROVIDERS[provider]
+        batch = [prompts[index] for index in missing]
+        if use_batch_api and adapter.generate_batch is not None:
+            fetched = await asyncio.to_thread(adapter.generate_batch, batch, model, timeout_seconds)
+        else:
+            fetched = await adapter.generate_many(batch, model, timeout_seconds)
+    return _merge_fetched_batch(keys, outcomes, missing, fetched)
+
+
+def _lookup_cached_batch(
+    provider: str, model: str, prompts: list[str], attempt: int
+) -> tuple[list[CacheKey] | None, list[str | Exception | None]]:
+    """Look up every prompt of a batch in `RESPONSE_CACHE`.
+
+    Input contract:
+    - Same arguments as `call_provider_batch`.
+
+    Output contract:
+    - Returns `(keys, outcomes)`: cache keys (`None` when caching is off)
+      and per-prompt cached responses, `None` where the prompt missed.
+
+    Side effects:
+    - Marks cache hits as recently used.
+    """
+
+    if not RESPONSE_CACHE.maxsize:
+        return None, [None] * len(prompts)
+    keys = [response_cache_key(provider, model, prompt, attempt) for prompt in prompts]
+    return keys, [RESPONSE_CACHE.get(key) for key in keys]
+
+
+def _merge_fetched_batch(
+    keys: list[CacheKey] | None,
+    outcomes: list[str | Exception | None],
+    missing: list[int],
+    fetched: list[str | Exception],
+) -> list[str | Exception]:
+    """Fill cache misses with fetched outcomes and cache the successful ones.
+
+    Input contract:
+    - `keys` and `outcomes` come from `_lookup_cached_batch`.
+    - `fetched` is aligned with the `missing` indices.
+
+    Output contract:
+    - Returns one response text or exception per prompt, in order.
+
+    Side effects:
+    - Stores fetched response texts in `RESPONSE_CACHE`.
+    """
+
+    for index, outcome in zip(missing, fetched, strict=True):
+        outcomes[index] = outcome
+        if keys is not None and isinstance(outcome, str):
+            RESPONSE_CACHE.put(keys[index], outcome)
+    return [
+        outcome if outcome is not None else RuntimeError("Provider returned no response.")
+        for outcome in outcomes
+    ]
+
+
+def _generate_uncached_batch(
+    provider: str,
+    model: str,
+    prompts: list[str],
+    use_batch_api: bool,
+    timeout_seconds: float | None,
+) -> list[str | Exception]:
+    """Send a batch of prompts to a provider, bypassing the response cache.
+
+    Input contract:
+    - Same as `call_provider_batch`; `provider` is already validated.
+
+    Output contract:
+    - Returns per-prompt response texts or exceptions, in `prompts` order.
+
+    Side effects:
+    - Performs network I/O via provider implementation.
+    """
+
+    adapter = PROVIDERS[provider]
+    generate_batch = adapter.generate_batch
+    if use_batch_api and generate_batch is not None:
+        return generate_batch(prompts, model, timeout_seconds)
+
+    generate = adapter.generate
+
+    def call_one(prompt: str) -> str | Exception:
+        try:
+            return generate(prompt, model, timeout_seconds)
+        except Exception as exc:  # noqa: BLE001
+            return exc
+
+    if len(prompts) <= 1:
+        return [call_one(prompt) for prompt in prompts]
+    return list(_BATCH_EXECUTOR.map(call_one, prompts))
 
 
 def sanitize_output(raw: str) -> str:
@@ -104,16 +608,27 @@ def sanitize_output(raw: str) -> str:
     """
 
     cleaned = raw.strip()
-    cleaned = re.sub(r"^```(?:json)?", "", cleaned).strip()
-    cleaned = re.sub(r"```$", "", cleaned).strip()
-    return cleaned
-
-
-def safe_parse_json(text: str) -> dict[str, Any] | None:
+    if cleaned.startswith("```json"):
+        start = 7
+    elif cleaned.startswith("```"):
+        start = 3
+    else:
+        start = 0
+    end = len(cleaned)
+    # The closing fence must not overlap the opening one (e.g. a bare "````").
+    if cleaned.endswith("```") and end - 3 >= start:
+        end -= 3
+    if start == 0 and end == len(cleaned):
+        return cleaned
+    # Slice the fenced body out once instead of re-copying after each strip.
+    return cleaned[start:end].strip()
+
+
+def safe_parse_json(text: str | bytes) -> dict[str, Any] | None:
     """Parse JSON safely without raising to callers.
 
     Input contract:
-    - `text` should be JSON object text.
+    - `text` should be JSON object text or UTF-8 encoded JSON bytes.
 
     Output contract:
     - Returns decoded dict on success, else `None`.
@@ -123,8 +638,8 @@ def safe_parse_json(text: str) -> dict[str, Any] | None:
     """
 
     try:
-        parsed = json.loads(text)
-    except json.JSONDecodeError:
+        parsed = jsonio.loads(text)
+    except ValueError:
         return None
     return parsed if isinstance(parsed, dict) else None
 
@@ -163,6 +678,11 @@ def generate_commit(
     constraints: dict[str, Any] | None,
     feedback: str | None = None,
     debug: bool = False,
+    max_diff_bytes: int | None = None,
+    prebuilt_prompt: str | None = None,
+    timeout_seconds: float | None = None,
+    attempt: int = 0,
+    cancel: threading.Event | None = None,
 ) -> GeneratorOutput:
     """Generate a commit candidate from diff context and prompt strategy.
 
@@ -171,6 +691,14 @@ def generate_commit(
     - `prompt_strategy` selects prompt template.
     - `provider_name` and `model` identify generation backend.
     - `intent`, `constraints`, and `feedback` are optional hints.
+    - `max_diff_bytes` optionally caps the diff embedded in the prompt.
+    - `prebuilt_prompt`, when given, is sent as-is and the prompt inputs above
+      are not re-rendered.
+    - `timeout_seconds` is the provider HTTP timeout; `None` keeps the
+      provider default.
+    - `attempt` is the engine retry index, so retries are not served the
+      cached response of an earlier attempt.
+    - `cancel` optionally abandons a streaming generation; see `call_provider`.
 
     Output contract:
     - Returns `GeneratorOutput` with parsed commit or normalized error code.
@@ -182,15 +710,53 @@ def generate_commit(
     """
 
     try:
-        template = load_prompt(prompt_strategy)
-        prompt = build_prompt(template, context, intent, constraints)
-        if feedback:
-            prompt = f"{prompt}\n\nFeedback:\n{feedback}"
+        prompt = prebuilt_prompt
+        if prompt is None:
+            template = load_prompt_template(prompt_strategy)
+            prompt = build_prompt(template, context, intent, constraints, max_diff_bytes, feedback)
         debug_log(debug, "prompt_built", {"prompt": prompt})
-        raw = call_provider(provider_name, model, prompt)
+        raw = call_provider(provider_name, model, prompt, timeout_seconds, attempt, cancel)
         debug_log(debug, "provider_raw_output", {"raw": raw})
     except Exception as exc:  # noqa: BLE001
-        return GeneratorOutput(commit=None, error="provider_error", meta={"reason": str(exc)})
+        return _provider_error_output(exc)
+
+    return _parse_raw_output(raw, provider_name, model, debug)
+
+
+def _provider_error_output(exc: BaseException) -> GeneratorOutput:
+    """Convert a provider/prompt failure into a generator result.
+
+    Input contract:
+    - `exc` is the exception raised while building or sending a prompt.
+
+    Output contract:
+    - Returns `GeneratorOutput` with `error="provider_error"`; `meta["retryable"]`
+      tells the engine whether another attempt can succeed.
+
+    Side effects:
+    - None.
+    """
+
+    return GeneratorOutput(
+        commit=None,
+        error="provider_error",
+        meta={"reason": str(exc), "retryable": is_transient_error(exc)},
+    )
+
+
+def _parse_raw_output(raw: str, provider_name: str, model: str, debug: bool) -> GeneratorOutput:
+    """Convert one raw provider response into a generator result.
+
+    Input contract:
+    - `raw` is untrusted model response text.
+    - `provider_name` and `model` identify the backend that produced it.
+
+    Output contract:
+    - Returns `GeneratorOutput` with parsed commit or normalized error code.
+
+    Side effects:
+    - Emits debug logs when `debug=True`.
+    """
 
     cleaned = sanitize_output(raw)
     debug_log(debug, "provider_cleaned_output", {"cleaned": cleaned})
@@ -205,3 +771,164 @@ def generate_commit(
 
     debug_log(debug, "generator_success", {"provider": provider_name, "model": model})
     return GeneratorOutput(commit=commit, error=None, meta={"provider": provider_name, "model": model})
+
+
+def generate_commits(
+    context: DiffContext,
+    targets: list[tuple[str, dict[str, Any] | None]],
+    provider_name: str,
+    model: str,
+    intent: str | None,
+    debug: bool = False,
+    max_diff_bytes: int | None = None,
+    use_batch_api: bool = True,
+    prebuilt_prompts: list[str | None] | None = None,
+    timeout_seconds: float | None = None,
+    attempt: int = 0,
+) -> list[GeneratorOutput]:
+    """Generate commit candidates for several prompts with one batched provider call.
+
+    Input contract:
+    - `context` must come from analyzer.
+    - `targets` lists `(prompt_strategy, constraints)` pairs sharing one backend.
+    - `provider_name` and `model` identify generation backend.
+    - `max_diff_bytes` optionally caps the diff embedded in each prompt.
+    - `use_batch_api` selects the provider's native batch API when available.
+    - `prebuilt_prompts`, when given, is aligned with `targets`; non-`None`
+      entries are sent as-is instead of being rendered again.
+    - `timeout_seconds` is the per-request provider HTTP timeout.
+    - `attempt` is the engine retry round, part of the response cache key.
+
+    Output contract:
+    - Returns one `GeneratorOutput` per target, in input order; a failing
+      target only affects its own entry.
+
+    Side effects:
+    - Reads prompt templates.
+    - Calls external providers once for the whole batch.
+    - Emits debug logs when `debug=True`.
+    """
+
+    prepared = _prepare_batch_prompts(
+        context, targets, intent, max_diff_bytes, prebuilt_prompts, debug
+    )
+    prompts = [item for item in prepared if isinstance(item, str)]
+    try:
+        raws = call_provider_batch(
+            provider_name, model, prompts, use_batch_api, timeout_seconds, attempt
+        )
+    except Exception as exc:  # noqa: BLE001
+        raws = [exc] * len(prompts)
+    return _batch_outputs(prepared, raws, provider_name, model, debug)
+
+
+async def generate_commits_async(
+    context: DiffContext,
+    targets: list[tuple[str, dict[str, Any] | None]],
+    provider_name: str,
+    model: str,
+    intent: str | None,
+    debug: bool = False,
+    max_diff_bytes: int | None = None,
+    use_batch_api: bool = True,
+    prebuilt_prompts: list[str | None] | None = None,
+    timeout_seconds: float | None = None,
+    attempt: int = 0,
+) -> list[GeneratorOutput]:
+    """Generate commit candidates for several prompts from asyncio code.
+
+    Input contract:
+    - Same as `generate_commits`.
+
+    Output contract:
+    - Same as `generate_commits`.
+
+    Side effects:
+    - Same as `generate_commits`, awaiting `call_provider_batch_async`.
+    """
+
+    prepared = _prepare_batch_prompts(
+        context, targets, intent, max_diff_bytes, prebuilt_prompts, debug
+    )
+    prompts = [item for item in prepared if isinstance(item, str)]
+    try:
+        raws = await call_provider_batch_async(
+            provider_name, model, prompts, use_batch_api, timeout_seconds, attempt
+        )
+    except Exception as exc:  # noqa: BLE001
+        raws = [exc] * len(prompts)
+    return _batch_outputs(prepared, raws, provider_name, model, debug)
+
+
+def _prepare_batch_prompts(
+    context: DiffContext,
+    targets: list[tuple[str, dict[str, Any] | None]],
+    intent: str | None,
+    max_diff_bytes: int | None,
+    prebuilt_prompts: list[str | None] | None,
+    debug: bool,
+) -> list[str | Exception]:
+    """Render one prompt per batch target, keeping build errors per target.
+
+    Input contract:
+    - Same as the matching `generate_commits` arguments.
+
+    Output contract:
+    - Returns, per target, its prompt text or the exception raised while
+      building it, so one bad template does not fail the other targets.
+
+    Side effects:
+    - Reads prompt templates.
+    - Emits debug logs when `debug=True`.
+    """
+
+    prepared: list[str | Exception] = []
+    for (strategy, constraints), prebuilt in zip(
+        targets, prebuilt_prompts or [None] * len(targets)
+    ):
+        try:
+            prepared.append(
+                prebuilt
+                if prebuilt is not None
+                else build_prompt(
+                    load_prompt_template(strategy), context, intent, constraints, max_diff_bytes
+                )
+            )
+        except Exception as exc:  # noqa: BLE001
+            prepared.append(exc)
+    debug_log(
+        debug, "batch_prompts_built", {"count": sum(isinstance(item, str) for item in prepared)}
+    )
+    return prepared
+
+
+def _batch_outputs(
+    prepared: list[str | Exception],
+    raws: list[str | Exception],
+    provider_name: str,
+    model: str,
+    debug: bool,
+) -> list[GeneratorOutput]:
+    """Pair batch provider outcomes back with their targets and parse them.
+
+    Input contract:
+    - `prepared` comes from `_prepare_batch_prompts`.
+    - `raws` holds one outcome per prompt text in `prepared`, in order.
+
+    Output contract:
+    - Returns one `GeneratorOutput` per prepared target, in order.
+
+    Side effects:
+    - Emits debug logs when `debug=True`.
+    """
+
+    sent = iter(raws)
+    outputs: list[GeneratorOutput] = []
+    for item in prepared:
+        raw = next(sent) if isinstance(item, str) else item
+        if isinstance(raw, Exception):
+            outputs.append(_provider_error_output(raw))
+            continue
+        debug_log(debug, "provider_raw_output", {"raw": raw})
+        outputs.append(_parse_raw_output(raw, provider_name, model, debug))
+    return outputs
@@ -0,0 +1,103 @@
+"""JSON encode/decode helpers with an optional `orjson` fast path.
+
+`orjson` is used when installed; otherwise the stdlib `json` module is used
+with matching compact, non-ASCII-preserving output so both backends produce
+identical bytes for the payloads this project serializes.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed extras
+    orjson = None
+
+# `orjson.JSONDecodeError` subclasses `json.JSONDecodeError`, so callers can
+# catch this one name regardless of the active backend.
+JSONDecodeError = json.JSONDecodeError
+
+
+def dumps_bytes(
+    obj: Any,
+    *,
+    sort_keys: bool = False,
+    indent: bool = False,
+    newline: bool = False,
+) -> bytes:
+    """Serialize `obj` to UTF-8 JSON bytes.
+
+    Input contract:
+    - `obj` is JSON-serializable with string keys.
+    - `indent` enables two-space pretty printing.
+    - `newline` appends a trailing `\\n`.
+
+    Output contract:
+    - Returns compact (or indented) UTF-8 encoded JSON.
+
+    Side effects:
+    - None.
+    """
+
+    if orjson is not None:
+        option = 0
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if newline:
+            option |= orjson.OPT_APPEND_NEWLINE
+        return orjson.dumps(obj, option=option)
+    text = json.dumps(
+        obj,
+        sort_keys=sort_keys,
+        ensure_ascii=False,
+        indent=2 if indent else None,
+        separators=None if indent else (",", ":"),
+    )
+    if newline:
+        text += "\n"
+    return text.encode("utf-8")
+
+
+def dumps(obj: Any, *, sort_keys: bool = False, indent: bool = False) -> str:
+    """Serialize `obj` to a JSON string.
+
+    Input contract:
+    - Same as `dumps_bytes`.
+
+    Output contract:
+    - Returns the decoded JSON text.
+
+    Side effects:
+    - None.
+    """
+
+    return dumps_bytes(obj, sort_keys=sort_keys, indent=indent).decode("utf-8")
+
+
+def loads(data: str | bytes) -> Any:
+    """Decode JSON text or UTF-8 bytes.
+
+    Input contract:
+    - `data` is JSON text or UTF-8 encoded JSON.
+
+    Output contract:
+    - Returns the decoded Python value.
+    - Raises `JSONDecodeError` on malformed input, including bytes that are
+      not valid UTF-8, with either backend.
+
+    Side effects:
+    - None.
+    """
+
+    if orjson is not None:
+        return orjson.loads(data)
+    try:
+        return json.loads(data)
+    except UnicodeDecodeError as exc:
+        # The stdlib decodes bytes before parsing; report bad UTF-8 the way
+        # orjson does so callers catch a single exception type.
+        raise JSONDecodeError(f"Invalid UTF-8: {exc.reason}", "", exc.start) from exc
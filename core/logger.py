@@ -6,16 +6,47 @@ Logger functions are side-effect-only and must never control flow decisions.
 from __future__ import annotations
 
 import datetime
-import json
-from dataclasses import asdict
+import threading
+import time
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 from rich.console import Console
 
-from core.types import EngineResult, RunLogRecord
+from core import jsonio
+from core.types import EngineResult
 
-console = Console()
+# Progress and debug lines go to stderr so stdout carries only command output.
+console = Console(stderr=True)
+
+LOG_BUFFER_SIZE = 1 << 16
+
+# `(epoch_second, "YYYY-MM-DDTHH:MM:SS")` for the most recent log second.
+_timestamp_prefix: tuple[int, str] = (-1, "")
+
+
+def _utc_timestamp() -> str:
+    """Return the current UTC time as an ISO-8601 string with microseconds.
+
+    Input contract:
+    - None.
+
+    Output contract:
+    - Returns e.g. `2024-01-01T12:00:00.123456+00:00`.
+
+    Side effects:
+    - Caches the formatted date/time prefix for the current second.
+    """
+
+    global _timestamp_prefix
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_second, prefix = _timestamp_prefix
+    if seconds != cached_second:
+        prefix = datetime.datetime.fromtimestamp(seconds, datetime.timezone.utc).strftime(
+            "%Y-%m-%dT%H:%M:%S"
+        )
+        _timestamp_prefix = (seconds, prefix)
+    return f"{prefix}.{nanos // 1000:06d}+00:00"
 
 
 def debug_log(enabled: bool, event: str, payload: dict[str, Any]) -> None:
@@ -30,13 +61,13 @@ def debug_log(enabled: bool, event: str, payload: dict[str, Any]) -> None:
     - No return value.
 
     Side effects:
-    - Writes one JSON line to stdout when enabled.
+    - Writes one JSON line to stderr when enabled.
     """
 
     if not enabled:
         return
     record = {"event": event, "payload": payload}
-    console.print(json.dumps(record, sort_keys=True), style="dim")
+    console.print(jsonio.dumps(record, sort_keys=True), style="dim")
 
 
 def info_log(
@@ -55,13 +86,13 @@ def info_log(
     - No return value.
 
     Side effects:
-    - Writes one JSON line to stdout.
+    - Writes one JSON line to stderr.
     """
 
     style = color if color else "default"
     console.print(f"[bold {style}]{message}[/bold {style}]", style=style)
     if payload:
-        console.print(json.dumps(payload, indent=2, sort_keys=True), style="dim")
+        console.print(jsonio.dumps(payload, indent=True, sort_keys=True), style="dim")
 
 
 
@@ -70,28 +101,48 @@ class RunLogger:
 
     Input contract:
     - `log_path` is a writable file path.
+    - `flush_every` is the number of rows buffered between flushes.
 
     Output contract:
     - Produces one JSON object per line.
+    - Usable as a context manager that flushes and closes on exit.
 
     Side effects:
-    - Creates parent directories and writes to filesystem.
+    - On the first `log_run`, creates parent directories and opens the log
+      file, keeping it open until `close`.
+    - Serializes concurrent `log_run` calls with an internal lock.
     """
 
-    def __init__(self, log_path: str = "eval/runs.jsonl") -> None:
+    def __init__(self, log_path: str = "eval/runs.jsonl", flush_every: int = 64) -> None:
         """Initialize logger with target JSONL path.
 
         Input contract:
         - `log_path` is relative or absolute file path string.
+        - `flush_every` must be positive.
 
         Output contract:
         - Ready-to-use `RunLogger` instance.
 
         Side effects:
-        - None.
+        - None; the log file is opened by the first `log_run`.
         """
 
         self.log_path = Path(log_path)
+        self.flush_every = max(1, flush_every)
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._closed = False
+        self._file: BinaryIO | None = None
+
+    def __enter__(self) -> RunLogger:
+        """Return self so the logger can be used in a `with` block."""
+
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Flush and close the log file on block exit."""
+
+        self.close()
 
     def log_run(self, result: EngineResult) -> None:
         """Serialize and append one result row.
@@ -103,11 +154,51 @@ class RunLogger:
         - No return value.
 
         Side effects:
-        - Appends one JSON line to configured file path.
+        - Opens `log_path` for appending on the first call.
+        - Buffers one JSON line, flushing every `flush_every` rows.
         """
 
         payload = self._serialize_result(result)
-        self._append_jsonl(payload)
+        with self._lock:
+            self._append_jsonl(payload)
+
+    def flush(self) -> None:
+        """Flush buffered rows to the OS without forcing an fsync.
+
+        Input contract:
+        - None.
+
+        Output contract:
+        - No return value.
+
+        Side effects:
+        - Writes pending buffered bytes to `self.log_path`.
+        """
+
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+            self._pending = 0
+
+    def close(self) -> None:
+        """Flush and close the log file; safe to call more than once.
+
+        Input contract:
+        - None.
+
+        Output contract:
+        - No return value.
+
+        Side effects:
+        - Closes the underlying file handle.
+        """
+
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            self._closed = True
+            self._pending = 0
 
     def _serialize_result(self, result: EngineResult) -> dict[str, Any]:
         """Convert `EngineResult` into stable schema payload.
@@ -116,39 +207,52 @@ class RunLogger:
         - `result` contains execution metadata and optional commit.
 
         Output contract:
-        - JSON-serializable dictionary with fixed keys.
+        - JSON-serializable dictionary with fixed keys in sorted order.
 
         Side effects:
         - None.
         """
 
-        record = RunLogRecord(
-            schema_version="1.0",
-            timestamp_utc=datetime.datetime.now(datetime.UTC).isoformat(),
-            provider=result.meta.get("provider"),
-            model=result.meta.get("model"),
-            strategy=result.meta.get("strategy"),
-            valid=len(result.violations) == 0 and result.error is None,
-            violations=list(result.violations),
-            retries=result.retries,
-            latency_ms=result.latency_ms,
-            word_count=result.commit.word_count if result.commit else None,
-        )
-        return asdict(record)
+        # Keys mirror `RunLogRecord`, built inline to skip `asdict` deep copies
+        # and written in sorted order so rows serialize without `sort_keys`.
+        meta = result.meta
+        commit = result.commit
+        return {
+            "latency_ms": result.latency_ms,
+            "model": meta.get("model"),
+            "provider": meta.get("provider"),
+            "retries": result.retries,
+            "schema_version": "1.0",
+            "strategy": meta.get("strategy"),
+            "timestamp_utc": _utc_timestamp(),
+            "valid": not result.violations and result.error is None,
+            "violations": result.violations,
+            "word_count": commit.word_count if commit else None,
+        }
 
     def _append_jsonl(self, payload: dict[str, Any]) -> None:
         """Append one payload object to JSONL file.
 
         Input contract:
-        - `payload` is JSON-serializable mapping.
+        - `payload` is a JSON-serializable mapping whose keys are already in
+          output order.
 
         Output contract:
         - No return value.
 
         Side effects:
-        - Writes to `self.log_path`.
+        - Creates the parent directory and opens `self.log_path` on first use.
+        - Writes to the buffered `self.log_path` handle.
+        - Raises `RuntimeError` when the logger has been closed.
         """
 
-        self.log_path.parent.mkdir(parents=True, exist_ok=True)
-        with self.log_path.open("a", encoding="utf-8") as file:
-            file.write(json.dumps(payload, sort_keys=True) + "\n")
+        if self._closed:
+            raise RuntimeError("RunLogger is closed")
+        if self._file is None:
+            self.log_path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = self.log_path.open("ab", buffering=LOG_BUFFER_SIZE)
+        self._file.write(jsonio.dumps_bytes(payload, newline=True))
+        self._pending += 1
+        if self._pending >= self.flush_every:
+            self._file.flush()
+            self._pending = 0
@@ -15,7 +15,7 @@ ModelName = str
 PromptStrategy = str
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class DiffContext:
     """Immutable snapshot of staged git state used by generation.
 
@@ -87,7 +87,8 @@ class ValidationResult:
     """Validation-only response from validator layer.
 
     Input contract:
-    - `violations` lists schema/rule violations, empty when valid.
+    - `violations` lists schema/rule violations, empty when valid; a tuple so
+      it can be shared without copying.
     - `word_count` is derived from commit content when available.
 
     Output contract:
@@ -97,7 +98,7 @@ class ValidationResult:
     - None.
     """
 
-    violations: list[str] = field(default_factory=list)
+    violations: tuple[str, ...] = ()
     word_count: int | None = None
 
 
@@ -136,7 +137,8 @@ class RunLogRecord:
     - Every field must be JSON-serializable.
 
     Output contract:
-    - Serialized as one JSON object per line in run logs.
+    - Serialized as one JSON object per line in run logs; `RunLogger` emits
+      these keys directly and must be kept in sync with this schema.
 
     Side effects:
     - None.
@@ -2,15 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
+from itertools import product
 
 from config.loader import LabBatchConfig, LabSingleConfig, load_lab_config
-import time
-
-from config.loader import LabBatchConfig, LabSingleConfig, load_lab_config
+from core.analyzer import read_git_context
+from core.engine import GroupCallback, run_matrix, run_matrix_async
 from core.logger import RunLogger
 from core.types import EngineResult
-from lab.runner import run_single_experiment
 
 
 @dataclass(slots=True)
@@ -50,23 +50,25 @@ def _expand_batch_matrix(batch_config: LabBatchConfig) -> list[tuple[str, LabSin
     - None.
     """
 
-    expanded: list[tuple[str, LabSingleConfig]] = []
-    for provider, models in batch_config.providers.items():
-        for model in models:
-            for strategy in batch_config.strategies:
-                for constraint_label, constraint in batch_config.constraints.items():
-                    expanded.append(
-                        (
-                            constraint_label,
-                            LabSingleConfig(
-                                provider=provider,
-                                model=model,
-                                strategy=strategy,
-                                constraints=constraint,
-                            ),
-                        )
-                    )
-    return expanded
+    targets = [
+        (provider, model)
+        for provider, models in batch_config.providers.items()
+        for model in models
+    ]
+    return [
+        (
+            constraint_label,
+            LabSingleConfig(
+                provider=provider,
+                model=model,
+                strategy=strategy,
+                constraints=constraint,
+            ),
+        )
+        for (provider, model), strategy, (constraint_label, constraint) in product(
+            targets, batch_config.strategies, batch_config.constraints.items()
+        )
+    ]
 
 
 def run_batch_experiments(
@@ -75,37 +77,133 @@ def run_batch_experiments(
     timeout_seconds: int = 60,
     intent: str | None = None,
     debug: bool = False,
+    max_concurrency: int = 8,
+    use_batch_api: bool = True,
 ) -> list[BatchExperimentResult]:
     """Run all generated batch combinations and log each run.
 
     Input contract:
     - `batch_config` defines matrix values for providers/models/strategies/constraints.
     - `max_retries`, `timeout_seconds`, `intent`, and `debug` are execution controls.
+    - `max_concurrency` caps provider/model groups in flight at once.
+    - `use_batch_api` submits each provider/model group through the provider's
+      native batch API when available, else through concurrent single calls.
 
     Output contract:
     - Returns ordered list of `BatchExperimentResult` rows.
 
     Side effects:
-    - Executes core engine per generated combination.
-    - Appends machine-readable run logs via `RunLogger`.
+    - Reads git context once and shares it across all combinations.
+    - Executes core engine with provider calls batched per provider/model;
+      rate-limited providers pace their own requests, so concurrent rows
+      stay under quota. Failed rows get one fallback pass on the same
+      target, as single lab runs do.
+    - Appends machine-readable run logs via `RunLogger` as each
+      provider/model group finishes.
     """
 
-    logger = RunLogger()
-    rows: list[BatchExperimentResult] = []
-
-    for index, (constraint_label, single_config) in enumerate(
-        _expand_batch_matrix(batch_config), start=1
-    ):
-        result = run_single_experiment(
-            single_config=single_config,
+    expanded = _expand_batch_matrix(batch_config)
+    context = read_git_context(debug=debug)
+    with RunLogger() as logger:
+        results = run_matrix(
+            targets=[single_config for _, single_config in expanded],
+            context=context,
+            intent=intent,
             max_retries=max_retries,
+            debug=debug,
+            max_workers=max_concurrency,
+            use_batch_api=use_batch_api,
             timeout_seconds=timeout_seconds,
+            on_group_done=_group_logger(logger, timeout_seconds),
+        )
+    return _batch_rows(expanded, results)
+
+
+async def run_batch_experiments_async(
+    batch_config: LabBatchConfig,
+    max_retries: int = 3,
+    timeout_seconds: int = 60,
+    intent: str | None = None,
+    debug: bool = False,
+    max_concurrency: int = 8,
+    use_batch_api: bool = True,
+) -> list[BatchExperimentResult]:
+    """Run all batch combinations as asyncio tasks and log each run.
+
+    Input contract:
+    - Same as `run_batch_experiments`.
+
+    Output contract:
+    - Returns ordered list of `BatchExperimentResult` rows.
+
+    Side effects:
+    - Reads git context once, off the event loop, and shares it across all
+      combinations.
+    - Runs each provider/model group as a task that awaits the provider's
+      async `generate_many`; failed rows get one fallback pass.
+    - Appends machine-readable run logs via `RunLogger` as each
+      provider/model group finishes.
+    """
+
+    expanded = _expand_batch_matrix(batch_config)
+    context = await asyncio.to_thread(read_git_context, debug)
+    with RunLogger() as logger:
+        results = await run_matrix_async(
+            targets=[single_config for _, single_config in expanded],
+            context=context,
             intent=intent,
+            max_retries=max_retries,
             debug=debug,
+            max_workers=max_concurrency,
+            use_batch_api=use_batch_api,
+            timeout_seconds=timeout_seconds,
+            on_group_done=_group_logger(logger, timeout_seconds),
         )
-        logger.log_run(result)
+    return _batch_rows(expanded, results)
+
+
+def _group_logger(logger: RunLogger, timeout_seconds: int) -> GroupCallback:
+    """Build a `run_matrix` callback that logs each finished group.
+
+    Input contract:
+    - `logger` stays open while the matrix runs.
+    - `timeout_seconds` is recorded in each result's meta.
+
+    Output contract:
+    - Returns a callback accepting `(indices, results)` for one group.
+
+    Side effects:
+    - The callback annotates result meta, appends each result via `logger`,
+      and flushes so finished groups survive an interrupted batch.
+    """
+
+    def log_group(indices: list[int], results: list[EngineResult]) -> None:
+        for result in results:
+            result.meta["timeout_seconds"] = timeout_seconds
+            logger.log_run(result)
+        logger.flush()
+
+    return log_group
+
 
-        row = BatchExperimentResult(
+def _batch_rows(
+    expanded: list[tuple[str, LabSingleConfig]],
+    results: list[EngineResult],
+) -> list[BatchExperimentResult]:
+    """Pair batch results with their matrix rows.
+
+    Input contract:
+    - `expanded` and `results` are aligned by index.
+
+    Output contract:
+    - Returns ordered list of `BatchExperimentResult` rows.
+
+    Side effects:
+    - None.
+    """
+
+    return [
+        BatchExperimentResult(
             config_id=(
                 f"{index}:{single_config.provider}:{single_config.model}:"
                 f"{single_config.strategy}:{constraint_label}"
@@ -116,10 +214,10 @@ def run_batch_experiments(
             constraint_label=constraint_label,
             result=result,
         )
-        rows.append(row)
-        time.sleep(1)
-
-    return rows
+        for index, ((constraint_label, single_config), result) in enumerate(
+            zip(expanded, results, strict=True), start=1
+        )
+    ]
 
 
 def run_batch_from_config(
@@ -128,6 +226,8 @@ def run_batch_from_config(
     timeout_seconds: int = 60,
     intent: str | None = None,
     debug: bool = False,
+    max_concurrency: int = 8,
+    use_batch_api: bool = True,
 ) -> list[BatchExperimentResult]:
     """Load lab config and run batch mode combinations.
 
@@ -150,4 +250,6 @@ def run_batch_from_config(
         timeout_seconds=timeout_seconds,
         intent=intent,
         debug=debug,
+        max_concurrency=max_concurrency,
+        use_batch_api=use_batch_api,
     )
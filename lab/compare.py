@@ -37,9 +37,11 @@ def compare_configs(metrics_by_config: dict[str, dict]) -> list[tuple[str, float
     - None.
     """
 
-    scored: list[tuple[str, float]] = []
-    for config_id, metrics in metrics_by_config.items():
-        scored.append((config_id, _score_metrics(metrics)))
-
-    scored.sort(key=lambda item: (-item[1], item[0]))
-    return scored
+    # Config IDs are unique dict keys, so `(-score, config_id)` orders every
+    # row without a key function and never compares the trailing score.
+    scores = (
+        (config_id, _score_metrics(metrics)) for config_id, metrics in metrics_by_config.items()
+    )
+    decorated = [(-score, config_id, score) for config_id, score in scores]
+    decorated.sort()
+    return [(config_id, score) for _, config_id, score in decorated]
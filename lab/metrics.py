@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import Counter
 from typing import TypedDict
 
 from core.types import EngineResult
@@ -42,30 +43,35 @@ def compute_metrics(results: list[EngineResult]) -> dict[str, object]:
         }
 
     total_runs = len(results)
-    valid_runs = sum(1 for result in results if not result.violations and result.error is None)
-    average_latency = sum(result.latency_ms for result in results) / total_runs
-    retried_runs = sum(1 for result in results if result.retries > 0)
-    retry_rate = retried_runs / total_runs
+    valid_runs = 0
+    total_latency = 0
+    retried_runs = 0
+    word_count_total = 0
+    word_count_runs = 0
+    violation_frequency: Counter[str] = Counter()
+    for result in results:
+        violations = result.violations
+        if violations:
+            violation_frequency.update(violations)
+        elif result.error is None:
+            valid_runs += 1
+        total_latency += result.latency_ms
+        if result.retries > 0:
+            retried_runs += 1
+        commit = result.commit
+        if commit is not None and commit.word_count is not None:
+            word_count_total += commit.word_count
+            word_count_runs += 1
 
-    word_counts = [
-        result.commit.word_count
-        for result in results
-        if result.commit is not None and result.commit.word_count is not None
-    ]
     average_word_count = (
-        float(sum(word_counts)) / len(word_counts) if word_counts else 0.0
+        float(word_count_total) / word_count_runs if word_count_runs else 0.0
     )
 
-    violation_frequency: dict[str, int] = {}
-    for result in results:
-        for violation in result.violations:
-            violation_frequency[violation] = violation_frequency.get(violation, 0) + 1
-
     summary: MetricsSummary = {
         "valid_rate": valid_runs / total_runs,
-        "average_latency": average_latency,
-        "retry_rate": retry_rate,
+        "average_latency": total_latency / total_runs,
+        "retry_rate": retried_runs / total_runs,
         "average_word_count": average_word_count,
-        "violation_frequency": violation_frequency,
+        "violation_frequency": dict(violation_frequency),
     }
     return summary
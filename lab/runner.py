@@ -21,7 +21,8 @@ def _to_prod_config(
     - `max_retries` and `timeout_seconds` are execution controls.
 
     Output contract:
-    - Returns `ProdConfig` consumable by `core.engine.run_once`.
+    - Returns `ProdConfig` consumable by `core.engine.run_once`; hedging is
+      disabled because the fallback target equals the primary target.
 
     Side effects:
     - None.
@@ -39,6 +40,7 @@ def _to_prod_config(
         constraints=single.constraints,
         max_retries=max_retries,
         timeout_seconds=timeout_seconds,
+        hedge_delay_seconds=None,
     )
 
 
@@ -6,14 +6,53 @@ CLI loads structured production config and delegates execution to prod app.
 from __future__ import annotations
 
 import argparse
-from typing import Any
+import sys
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+from core import jsonio
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+_PARSER = argparse.ArgumentParser(description="Commit Agent")
+_PARSER.add_argument(
+    "--config",
+    default="config/prod.yaml",
+    help="Path to production YAML config.",
+)
+_PARSER.add_argument(
+    "--intent",
+    default=None,
+    help="Optional user intent for commit generation.",
+)
+_PARSER.add_argument("--debug", action="store_true", help="Enable debug mode.")
+_PARSER.add_argument(
+    "--list-models",
+    metavar="PROVIDER",
+    default=None,
+    help="Print the models available from PROVIDER as JSON and exit.",
+)
+
+
+@lru_cache(maxsize=1)
+def _get_console() -> Console:
+    """Return the shared rich console, creating it on first use.
 
-from rich.console import Console
+    Input contract:
+    - None.
+
+    Output contract:
+    - Returns one process-wide `Console` instance.
+
+    Side effects:
+    - Imports `rich` lazily on first call.
+    """
 
-from config.loader import load_prod_config
-from prod.app import run_agent
+    from rich.console import Console
 
-console = Console()
+    return Console()
 
 
 def print_banner() -> None:
@@ -27,7 +66,31 @@ def print_banner() -> None:
 ╚██████╔╝██║   ██║   ██║  ██║╚██████╔╝██████╔╝      ╚██████╗╚██████╔╝██║ ╚═╝ ██║██║ ╚═╝ ██║██║   ██║       ██║  ██║╚██████╔╝███████╗██║ ╚████║   ██║
  ╚═════╝ ╚═╝   ╚═╝   ╚═╝  ╚═╝ ╚═════╝ ╚═════╝        ╚═════╝ ╚═════╝ ╚═╝     ╚═╝╚═╝     ╚═╝╚═╝   ╚═╝       ╚═╝  ╚═╝ ╚═════╝ ╚══════╝╚═╝  ╚═══╝   ╚═╝
 """
-    console.print(banner)
+    _get_console().print(banner)
+
+
+def _is_interactive() -> bool:
+    """Report whether both stdin and stdout are attached to a terminal."""
+
+    return sys.stdin.isatty() and sys.stdout.isatty()
+
+
+def _write_json(payload: dict[str, Any]) -> None:
+    """Write `payload` to stdout as indented JSON.
+
+    Input contract:
+    - `payload` is JSON-serializable.
+
+    Output contract:
+    - No return value.
+
+    Side effects:
+    - Flushes pending text output, then writes UTF-8 bytes to stdout.
+    """
+
+    sys.stdout.flush()
+    sys.stdout.buffer.write(jsonio.dumps_bytes(payload, indent=True, newline=True))
+    sys.stdout.buffer.flush()
 
 
 def main() -> None:
@@ -37,37 +100,48 @@ def main() -> None:
     - `--config` points to production YAML path.
     - `--intent` is optional user intent text.
     - `--debug` toggles debug logs.
+    - `--list-models` prints one provider's models instead of generating.
 
     Output contract:
-    - Returns `None`; prints structured summary to terminal.
+    - Returns `None`; prints the summary (or model list) to stdout as JSON.
 
     Side effects:
+    - Shows the banner and a confirmation prompt only on an interactive
+      terminal.
     - Reads config file.
     - Runs engine through production app.
     - Writes summary to terminal.
     """
 
-    print_banner()
+    # Parse first so `--help` and usage errors exit before the banner, prompt,
+    # and heavy imports.
+    args = _PARSER.parse_args()
+
+    if args.list_models is not None:
+        from providers.registry import PROVIDERS, list_models_cached
+
+        if args.list_models not in PROVIDERS:
+            _PARSER.error(f"unknown provider: {args.list_models}")
+        try:
+            models = list_models_cached(args.list_models)
+        except Exception as exc:  # noqa: BLE001
+            _PARSER.exit(1, f"Cannot list {args.list_models} models: {exc}\n")
+        _write_json({"provider": args.list_models, "models": models})
+        return
+
+    # Piped runs skip the banner and prompt so they stay out of the JSON
+    # stream and never block on input.
+    if _is_interactive():
+        print_banner()
 
-    choice = input("Press Enter to continue or type 'q' to quit: ")
+        choice = input("Press Enter to continue or type 'q' to quit: ")
 
-    if choice.lower() == "q":
-        print("Exiting commit-agent.")
-        exit(0)
+        if choice.lower() == "q":
+            print("Exiting commit-agent.")
+            exit(0)
 
-    parser = argparse.ArgumentParser(description="Commit Agent")
-    parser.add_argument(
-        "--config",
-        default="config/prod.yaml",
-        help="Path to production YAML config.",
-    )
-    parser.add_argument(
-        "--intent",
-        default=None,
-        help="Optional user intent for commit generation.",
-    )
-    parser.add_argument("--debug", action="store_true", help="Enable debug mode.")
-    args = parser.parse_args()
+    from config.loader import load_prod_config
+    from prod.app import run_agent
 
     config = load_prod_config(args.config)
     result = run_agent(config=config, user_hint=args.intent, debug=args.debug)
@@ -83,8 +157,8 @@ def main() -> None:
         payload["word_count"] = result.commit.word_count
         if result.commit.body:
             payload["body"] = result.commit.body
-    console.print(payload)
+    _write_json(payload)
 
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
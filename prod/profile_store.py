@@ -5,10 +5,11 @@ This module owns JSON persistence details so CLI never parses JSON directly.
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Any
 
+from core import jsonio
+
 
 MAIN_PROFILE_PATH = Path("config/main_profile.json")
 
@@ -23,13 +24,12 @@ def load_main_profile(path: Path = MAIN_PROFILE_PATH) -> dict[str, Any]:
     - Returns dictionary payload. Empty dict when missing/invalid.
 
     Side effects:
-    - Reads from filesystem.
+    - Reads from filesystem with a single open/read; a missing file is
+      handled as an error rather than pre-checked.
     """
 
-    if not path.exists():
-        return {}
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-    except Exception:  # noqa: BLE001
+        data = jsonio.loads(path.read_bytes())
+    except (OSError, ValueError):
         return {}
     return data if isinstance(data, dict) else {}
@@ -0,0 +1,47 @@
+"""Async fan-out helpers for blocking provider transports.
+
+Provider adapters use blocking `requests` sessions; this module overlaps many
+such calls from asyncio code without owning any endpoint or payload details.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Callable
+
+DEFAULT_ASYNC_CONCURRENCY = 5
+
+
+async def generate_concurrently(
+    generate: Callable[[str, str, float | None], str],
+    prompts: list[str],
+    model: str,
+    concurrency: int = DEFAULT_ASYNC_CONCURRENCY,
+    timeout: float | None = None,
+) -> list[str | Exception]:
+    """Run a blocking `generate` for many prompts with bounded concurrency.
+
+    Input contract:
+    - `generate` is a provider callable accepting `(prompt, model, timeout)`.
+    - `concurrency` caps in-flight calls and must be positive.
+    - `timeout` is the per-request HTTP timeout passed to every call.
+
+    Output contract:
+    - Returns one entry per prompt, in order: the raw response text, or the
+      exception that prompt's call raised. One failure never discards the
+      other responses.
+
+    Side effects:
+    - Runs each call on the default executor via `asyncio.to_thread`.
+    """
+
+    slots = asyncio.Semaphore(max(1, concurrency))
+
+    async def generate_one(prompt: str) -> str | Exception:
+        async with slots:
+            try:
+                return await asyncio.to_thread(generate, prompt, model, timeout)
+            except Exception as exc:  # noqa: BLE001
+                return exc
+
+    return list(await asyncio.gather(*(generate_one(prompt) for prompt in prompts)))
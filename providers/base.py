@@ -13,11 +13,19 @@ class Provider(Protocol):
     """Provider contract used by the registry.
 
     Input contract:
-    - Implementations must expose `list_models` and `generate`.
+    - Implementations must expose `list_models`, `generate` and
+      `generate_many`.
+    - `timeout` is an HTTP timeout in seconds, or `None` for the provider's
+      default.
+    - Modules may also expose `generate_batch(prompts, model, timeout)` for a
+      native batch API and `generate_stream(prompt, model, timeout)` yielding
+      text fragments; the registry treats both as optional.
 
     Output contract:
     - `list_models` returns model identifiers.
     - `generate` returns raw model text.
+    - `generate_many` returns, per prompt and in order, the raw model text or
+      the exception that prompt raised.
 
     Side effects:
     - Typically network I/O.
@@ -26,5 +34,10 @@ class Provider(Protocol):
     def list_models(self) -> list[str]:
         """Return available model identifiers for this provider."""
 
-    def generate(self, prompt: str, model: str) -> str:
+    def generate(self, prompt: str, model: str, timeout: float | None = None) -> str:
         """Generate text for a fully-prepared prompt payload."""
+
+    async def generate_many(
+        self, prompts: list[str], model: str, timeout: float | None = None
+    ) -> list[str | Exception]:
+        """Generate text for several prompts from asyncio code."""
@@ -0,0 +1,108 @@
+"""In-process cache of raw provider responses.
+
+Entries are keyed by provider, model, attempt index, and a BLAKE2b digest of
+the prompt, so identical calls are answered without another round trip while
+engine retries (which resend the same prompt) still receive fresh samples.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+RESPONSE_CACHE_SIZE = 512
+
+CacheKey = tuple[str, str, int, bytes]
+
+
+def response_cache_key(provider: str, model: str, prompt: str, attempt: int = 0) -> CacheKey:
+    """Build a compact cache key for one provider call.
+
+    Input contract:
+    - `attempt` is the engine retry index the call is made for.
+
+    Output contract:
+    - Returns a hashable key that holds a 16-byte prompt digest instead of
+      the prompt text.
+
+    Side effects:
+    - None.
+    """
+
+    digest = hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).digest()
+    return (provider, model, attempt, digest)
+
+
+class ResponseCache:
+    """Thread-safe LRU map from `CacheKey` to raw response text.
+
+    Input contract:
+    - `maxsize` is the entry limit; `0` disables caching.
+
+    Output contract:
+    - `get` returns a cached response or `None`; `put` stores one.
+
+    Side effects:
+    - Holds up to `maxsize` response strings in memory.
+    """
+
+    def __init__(self, maxsize: int = RESPONSE_CACHE_SIZE) -> None:
+        """Initialize an empty cache.
+
+        Input contract:
+        - `maxsize` must be non-negative.
+
+        Output contract:
+        - Ready-to-use `ResponseCache` instance.
+
+        Side effects:
+        - None.
+        """
+
+        self.maxsize = maxsize
+        self._entries: OrderedDict[CacheKey, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: CacheKey) -> str | None:
+        """Return the cached response for `key`, marking it recently used."""
+
+        with self._lock:
+            response = self._entries.get(key)
+            if response is not None:
+                self._entries.move_to_end(key)
+            return response
+
+    def put(self, key: CacheKey, response: str) -> None:
+        """Store `response`, evicting the least recently used entry if full."""
+
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = response
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+
+        with self._lock:
+            self._entries.clear()
+
+
+def cache_enabled() -> bool:
+    """Report whether `COMMIT_AGENT_RESPONSE_CACHE=1` opts into response caching.
+
+    Input contract:
+    - Reads the `COMMIT_AGENT_RESPONSE_CACHE` environment variable.
+
+    Output contract:
+    - Returns `True` when the variable is set to a truthy value.
+
+    Side effects:
+    - None.
+    """
+
+    return os.getenv("COMMIT_AGENT_RESPONSE_CACHE", "").strip().lower() in {"1", "true", "yes"}
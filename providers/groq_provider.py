@@ -7,13 +7,24 @@ or model defaults.
 from __future__ import annotations
 
 import os
-from dotenv import load_dotenv
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+
 import requests
+from dotenv import load_dotenv
+
+from core import jsonio
+from providers.async_transport import generate_concurrently
+from providers.ratelimit import RateLimiter
+from providers.transport import build_pool, build_session, pool_request, transport_backend
 
 load_dotenv()
 GROQ_MODELS_URL = "https://api.groq.com/openai/v1/models"
 GROQ_CHAT_URL = "https://api.groq.com/openai/v1/chat/completions"
-GROQ_API_KEY = os.getenv("GROQ_API_KEY")
+GROQ_ASYNC_CONCURRENCY = int(os.getenv("GROQ_ASYNC_CONCURRENCY", "5"))
+# Free-tier chat models allow 30 requests per minute; `0` disables pacing.
+GROQ_REQUESTS_PER_MINUTE = float(os.getenv("GROQ_REQUESTS_PER_MINUTE", "30"))
 EXCLUDED_MODEL_KEYWORDS = (
     "whisper",
     "guard",
@@ -21,16 +32,115 @@ EXCLUDED_MODEL_KEYWORDS = (
     "prompt-guard",
     "orpheus",
 )
+# A keyword containing a shorter one (e.g. "safeguard" vs "guard") can never
+# add a match, so only the minimal keywords go into the alternation.
+_EXCLUDED_MODEL_PATTERN = re.compile(
+    "|".join(
+        re.escape(keyword)
+        for keyword in EXCLUDED_MODEL_KEYWORDS
+        if not any(other != keyword and other in keyword for other in EXCLUDED_MODEL_KEYWORDS)
+    )
+)
+
+# One pooled session keeps TCP/TLS connections to the Groq API alive across calls.
+_SESSION = build_session(pool_connections=1, pool_maxsize=8)
+# Opt-in bare urllib3 pool (`COMMIT_AGENT_TRANSPORT=urllib3`) that skips the
+# `requests` wrapper on the request hot path.
+_POOL = build_pool(num_pools=1, maxsize=8) if transport_backend() == "urllib3" else None
+# Shared by every thread and task so concurrent lab rows stay under the quota.
+_RATE_LIMITER = RateLimiter(GROQ_REQUESTS_PER_MINUTE)
+
+
+@dataclass(frozen=True, slots=True)
+class GroqConfig:
+    """Environment-derived Groq settings, read once per process.
+
+    Input contract:
+    - `api_key` is the Groq API key, or `None` when unset.
+    - `timeout` bounds chat-completion requests in seconds.
+
+    Output contract:
+    - Immutable settings shared by every request.
+
+    Side effects:
+    - None.
+    """
+
+    api_key: str | None
+    timeout: float
+    chat_url: str = GROQ_CHAT_URL
+    models_url: str = GROQ_MODELS_URL
+
+
+@lru_cache(maxsize=1)
+def _config() -> GroqConfig:
+    """Return the cached Groq settings snapshot.
+
+    Input contract:
+    - Reads `GROQ_API_KEY` and `GROQ_TIMEOUT` on first call.
+
+    Output contract:
+    - Returns the same `GroqConfig` until `_reset_config` is called.
+
+    Side effects:
+    - None.
+    """
+
+    return GroqConfig(
+        api_key=os.getenv("GROQ_API_KEY") or None,
+        timeout=float(os.getenv("GROQ_TIMEOUT", "60")),
+    )
+
+
+def _reset_config() -> None:
+    """Drop cached settings and headers so the next call re-reads the environment."""
+
+    _config.cache_clear()
+    _auth_headers.cache_clear()
+
+
+def api_key_configured() -> bool:
+    """Report whether a Groq API key is available.
+
+    Input contract:
+    - None.
+
+    Output contract:
+    - Returns `True` when `GROQ_API_KEY` is set to a non-empty value.
+
+    Side effects:
+    - Reads the cached Groq settings snapshot.
+    """
+
+    return bool(_config().api_key)
+
+
+def get_session() -> requests.Session:
+    """Return the shared HTTP session used for Groq requests on the `requests` backend.
+
+    Input contract:
+    - None.
+
+    Output contract:
+    - Returns the module-level pooled `requests.Session`.
+
+    Side effects:
+    - None.
+    """
+
+    return _SESSION
 
 
+@lru_cache(maxsize=4)
 def _auth_headers(api_key: str) -> dict[str, str]:
-    """Build Groq API request headers.
+    """Build Groq API request headers, once per API key.
 
     Input contract:
     - `api_key` is a non-empty Groq API key string.
 
     Output contract:
-    - Returns headers required for Groq API requests.
+    - Returns headers required for Groq API requests. The mapping is shared
+      between calls and must not be mutated.
 
     Side effects:
     - None.
@@ -42,74 +152,167 @@ def _auth_headers(api_key: str) -> dict[str, str]:
     }
 
 
+def _request(
+    method: str,
+    url: str,
+    headers: dict[str, str],
+    timeout: float,
+    body: bytes | None = None,
+) -> bytes:
+    """Send one Groq API request over the selected transport backend.
+
+    Input contract:
+    - `body` is an already-serialized JSON payload, if any.
+
+    Output contract:
+    - Returns the raw response body.
+    - Raises `requests.HTTPError` on HTTP error statuses and another
+      `requests.RequestException` on transport failures, for either backend.
+
+    Side effects:
+    - Performs network I/O over pooled connections.
+    """
+
+    if _POOL is not None:
+        return pool_request(_POOL, method, url, headers=headers, timeout=timeout, body=body)
+    response = get_session().request(method, url, headers=headers, data=body, timeout=timeout)
+    response.raise_for_status()
+    return response.content
+
+
 def list_models() -> list[str]:
     """List available Groq model identifiers.
 
     Input contract:
-    - Uses `GROQ_API_KEY` from environment.
+    - Uses the API key from the cached `GroqConfig`.
 
     Output contract:
     - Returns sorted model ID list filtered by excluded keywords.
 
     Side effects:
-    - Performs HTTP GET request when API key is present.
+    - Performs HTTP GET request over the shared transport when API key is present.
     """
 
-    if not GROQ_API_KEY:
+    config = _config()
+    if not config.api_key:
         return []
 
     try:
-        response = requests.get(GROQ_MODELS_URL, headers=_auth_headers(GROQ_API_KEY), timeout=10)
-        response.raise_for_status()
-        data = response.json().get("data", [])
-    except requests.RequestException:
+        content = _request("GET", config.models_url, _auth_headers(config.api_key), timeout=10)
+        data = jsonio.loads(content).get("data", [])
+    except (requests.RequestException, jsonio.JSONDecodeError):
         return []
 
-    available_ids: list[str] = []
+    available_ids: set[str] = set()
     for model in data:
         model_id = model.get("id")
         if not isinstance(model_id, str):
             continue
         lowered = model_id.lower()
-        if any(keyword in lowered for keyword in EXCLUDED_MODEL_KEYWORDS):
+        if _EXCLUDED_MODEL_PATTERN.search(lowered):
             continue
-        available_ids.append(model_id)
+        available_ids.add(model_id)
+
+    return sorted(available_ids)
 
-    return sorted(set(available_ids))
+
+def _extract_completion(body: object) -> str:
+    """Return the assistant message text from a chat-completions body.
+
+    Input contract:
+    - `body` is the decoded JSON response of the chat-completions endpoint.
+
+    Output contract:
+    - Returns the first choice's message content.
+    - Raises `ValueError` when any level of the payload is missing or
+      mistyped, instead of a `KeyError`/`IndexError` from deep indexing.
+
+    Side effects:
+    - None.
+    """
+
+    choices = body.get("choices") if isinstance(body, dict) else None
+    first = choices[0] if isinstance(choices, list) and choices else None
+    message = first.get("message") if isinstance(first, dict) else None
+    text = message.get("content") if isinstance(message, dict) else None
+    if not isinstance(text, str):
+        raise ValueError("Invalid Groq response payload.")
+    return text
 
 
-def generate(prompt: str, model: str) -> str:
+def generate(prompt: str, model: str, timeout: float | None = None) -> str:
     """Generate completion text via Groq chat-completions API.
 
     Input contract:
     - `prompt` is fully composed upstream prompt text.
     - `model` is a model ID accepted by Groq API.
+    - `timeout` is the HTTP timeout in seconds; `None` uses `GroqConfig.timeout`.
 
     Output contract:
     - Returns assistant message content as string.
 
     Side effects:
-    - Performs HTTP POST request.
+    - Waits for a `GROQ_REQUESTS_PER_MINUTE` slot, then performs an HTTP POST
+      request over the shared transport.
     """
 
-    api_key = os.getenv("GROQ_API_KEY")
-    if not api_key:
+    config = _config()
+    if not config.api_key:
         raise RuntimeError("GROQ_API_KEY is not set.")
+    _RATE_LIMITER.acquire()
 
     payload = {
         "model": model,
         "messages": [{"role": "user", "content": prompt}],
         "temperature": 0.2,
     }
-    response = requests.post(
-        GROQ_CHAT_URL,
-        headers=_auth_headers(api_key),
-        json=payload,
-        timeout=60,
+    content = _request(
+        "POST",
+        config.chat_url,
+        _auth_headers(config.api_key),
+        timeout=config.timeout if timeout is None else timeout,
+        body=jsonio.dumps_bytes(payload),
     )
-    response.raise_for_status()
-    data = response.json()
-    text = data["choices"][0]["message"]["content"]
-    if not isinstance(text, str):
-        raise ValueError("Invalid Groq response payload.")
-    return text
+    return _extract_completion(jsonio.loads(content))
+
+
+async def generate_many(
+    prompts: list[str], model: str, timeout: float | None = None
+) -> list[str | Exception]:
+    """Generate completion texts for several prompts from asyncio code.
+
+    Input contract:
+    - `prompts` are fully composed upstream prompt texts.
+    - `model` is a model ID accepted by Groq API.
+    - `timeout` is the per-request HTTP timeout; `None` uses the configured one.
+
+    Output contract:
+    - Returns one entry per prompt, in order: the assistant message content,
+      or the exception that prompt's request raised.
+
+    Side effects:
+    - Keeps up to `GROQ_ASYNC_CONCURRENCY` HTTP POST requests in flight,
+      paced by the shared rate limiter.
+    """
+
+    return await generate_concurrently(
+        generate, prompts, model, GROQ_ASYNC_CONCURRENCY, timeout
+    )
+
+
+def close() -> None:
+    """Close pooled connections held by the shared transports.
+
+    Input contract:
+    - None.
+
+    Output contract:
+    - No return value.
+
+    Side effects:
+    - Closes open sockets; later calls reconnect on demand.
+    """
+
+    _SESSION.close()
+    if _POOL is not None:
+        _POOL.clear()
@@ -6,12 +6,40 @@ This module only handles API transport for already-built prompt text.
 from __future__ import annotations
 
 import os
+from collections.abc import Iterator
 
 import requests
 
+from core import jsonio
+from providers.async_transport import generate_concurrently
+from providers.transport import build_session
+
 OLLAMA_HOST = os.getenv("OLLAMA_HOST", "http://localhost:11434")
 OLLAMA_NUM_CTX = int(os.getenv("OLLAMA_NUM_CTX", "8192"))
 OLLAMA_TIMEOUT = int(os.getenv("OLLAMA_TIMEOUT", "120"))
+OLLAMA_BATCH_CONCURRENCY = int(os.getenv("OLLAMA_BATCH_CONCURRENCY", "4"))
+JSON_HEADERS = {"Content-Type": "application/json"}
+# Shared by every generate payload; serialized, never mutated.
+_GENERATE_OPTIONS = {"num_ctx": OLLAMA_NUM_CTX}
+
+# One pooled session keeps TCP connections to the Ollama host alive across calls.
+_SESSION = build_session(pool_connections=1, pool_maxsize=max(8, OLLAMA_BATCH_CONCURRENCY))
+
+
+def get_session() -> requests.Session:
+    """Return the shared HTTP session used for every Ollama request.
+
+    Input contract:
+    - None.
+
+    Output contract:
+    - Returns the module-level pooled `requests.Session`.
+
+    Side effects:
+    - None.
+    """
+
+    return _SESSION
 
 
 def list_models() -> list[str]:
@@ -21,46 +49,123 @@ def list_models() -> list[str]:
     - Reads `OLLAMA_HOST` environment configuration.
 
     Output contract:
-    - Returns model name list.
+    - Returns unique model names in the order Ollama reports them.
 
     Side effects:
-    - Performs HTTP GET request.
+    - Performs HTTP GET request over the shared session.
     """
 
-    response = requests.get(f"{OLLAMA_HOST}/api/tags", timeout=10)
+    response = get_session().get(f"{OLLAMA_HOST}/api/tags", timeout=10)
     response.raise_for_status()
-    models = response.json().get("models", [])
-    return [entry["name"] for entry in models if isinstance(entry.get("name"), str)]
+    models = jsonio.loads(response.content).get("models", [])
+    # Dict keys dedupe repeated tags in one pass while keeping server order.
+    names: dict[str, None] = {}
+    for entry in models:
+        name = entry.get("name")
+        if isinstance(name, str):
+            names[name] = None
+    return list(names)
 
 
-def generate(prompt: str, model: str) -> str:
+def generate(prompt: str, model: str, timeout: float | None = None) -> str:
     """Generate completion text from Ollama.
 
     Input contract:
     - `prompt` is already composed by generator layer.
     - `model` is a valid Ollama model identifier.
+    - `timeout` is the HTTP timeout in seconds; `None` uses `OLLAMA_TIMEOUT`.
 
     Output contract:
     - Returns raw response text from Ollama.
 
     Side effects:
-    - Performs HTTP POST request.
+    - Performs a streaming HTTP POST request over the shared session.
+    """
+
+    return "".join(generate_stream(prompt, model, timeout))
+
+
+def generate_stream(prompt: str, model: str, timeout: float | None = None) -> Iterator[str]:
+    """Yield completion text fragments from Ollama as they are generated.
+
+    Input contract:
+    - `prompt` is already composed by generator layer.
+    - `model` is a valid Ollama model identifier.
+    - `timeout` is the HTTP timeout in seconds; `None` uses `OLLAMA_TIMEOUT`.
+      Because the response streams, it bounds the wait for each chunk rather
+      than the whole generation.
+
+    Output contract:
+    - Yields response text fragments in order until Ollama reports `done`.
+    - Raises `ValueError` on an error line or malformed fragment.
+
+    Side effects:
+    - Performs a streaming HTTP POST request over the shared session; the
+      connection is released when the iterator is exhausted or closed.
     """
 
     payload = {
         "model": model,
         "prompt": prompt,
-        "stream": False,
-        "options": {"num_ctx": OLLAMA_NUM_CTX},
+        "stream": True,
+        "options": _GENERATE_OPTIONS,
     }
-    response = requests.post(
+    with get_session().post(
         f"{OLLAMA_HOST}/api/generate",
-        json=payload,
-        timeout=OLLAMA_TIMEOUT,
+        headers=JSON_HEADERS,
+        data=jsonio.dumps_bytes(payload),
+        timeout=OLLAMA_TIMEOUT if timeout is None else timeout,
+        stream=True,
+    ) as response:
+        response.raise_for_status()
+        for line in response.iter_lines():
+            if not line:
+                continue
+            chunk = jsonio.loads(line)
+            if "error" in chunk:
+                raise ValueError(f"Ollama error: {chunk['error']}")
+            fragment = chunk.get("response")
+            if not isinstance(fragment, str):
+                raise ValueError("Invalid Ollama response payload.")
+            yield fragment
+            if chunk.get("done"):
+                return
+
+
+async def generate_many(
+    prompts: list[str], model: str, timeout: float | None = None
+) -> list[str | Exception]:
+    """Generate completion texts for several prompts from asyncio code.
+
+    Input contract:
+    - `prompts` are already composed by generator layer.
+    - `model` is a valid Ollama model identifier.
+    - `timeout` is the per-request HTTP timeout; `None` uses `OLLAMA_TIMEOUT`.
+
+    Output contract:
+    - Returns one entry per prompt, in order: the raw response text, or the
+      exception that prompt's request raised.
+
+    Side effects:
+    - Keeps up to `OLLAMA_BATCH_CONCURRENCY` HTTP POST requests in flight.
+    """
+
+    return await generate_concurrently(
+        generate, prompts, model, OLLAMA_BATCH_CONCURRENCY, timeout
     )
-    response.raise_for_status()
-    body = response.json()
-    text = body.get("response")
-    if not isinstance(text, str):
-        raise ValueError("Invalid Ollama response payload.")
-    return text
+
+
+def close() -> None:
+    """Close pooled connections held by the shared session.
+
+    Input contract:
+    - None.
+
+    Output contract:
+    - No return value.
+
+    Side effects:
+    - Closes open sockets; later calls reconnect on demand.
+    """
+
+    _SESSION.close()
@@ -1,7 +1,8 @@
 """OpenAI provider adapter skeleton.
 
 Input contract:
-- Expose `list_models()` and `generate(prompt, model)` compatible with registry.
+- Expose `list_models()`, `generate(prompt, model, timeout)` and
+  `generate_many(prompts, model, timeout)` compatible with registry.
 
 Output contract:
 - Return model IDs and raw generated text.
@@ -29,12 +30,13 @@ def list_models() -> list[str]:
     raise NotImplementedError("OpenAI provider is not implemented.")
 
 
-def generate(prompt: str, model: str) -> str:
+def generate(prompt: str, model: str, timeout: float | None = None) -> str:
     """Generate response text using an OpenAI model.
 
     Input contract:
     - `prompt` must be fully prepared prompt text.
     - `model` must be valid provider model id.
+    - `timeout` is the per-request HTTP timeout; `None` uses the default.
 
     Output contract:
     - Returns raw text response.
@@ -43,5 +45,26 @@ def generate(prompt: str, model: str) -> str:
     - None in skeleton form.
     """
 
-    _ = (prompt, model)
+    _ = (prompt, model, timeout)
+    raise NotImplementedError("OpenAI provider is not implemented.")
+
+
+async def generate_many(
+    prompts: list[str], model: str, timeout: float | None = None
+) -> list[str | Exception]:
+    """Generate response texts for several prompts from asyncio code.
+
+    Input contract:
+    - `prompts` must be fully prepared prompt texts.
+    - `model` must be valid provider model id.
+    - `timeout` is the per-request HTTP timeout; `None` uses the default.
+
+    Output contract:
+    - Returns one entry per prompt: raw text, or the exception it raised.
+
+    Side effects:
+    - None in skeleton form.
+    """
+
+    _ = (prompts, model, timeout)
     raise NotImplementedError("OpenAI provider is not implemented.")
@@ -0,0 +1,55 @@
+"""Client-side request pacing for rate-limited provider APIs.
+
+Providers with per-minute quotas space their requests through a shared
+`RateLimiter` so concurrent callers stay under the quota instead of relying on
+429 responses and retries.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+
+class RateLimiter:
+    """Thread-safe limiter that spaces calls evenly across a minute.
+
+    Input contract:
+    - `requests_per_minute` is the sustained request budget; `0` or less
+      disables limiting.
+
+    Output contract:
+    - `acquire` returns once the caller may send one request.
+
+    Side effects:
+    - `acquire` may sleep the calling thread.
+    """
+
+    def __init__(self, requests_per_minute: float) -> None:
+        """Initialize a limiter whose first request is sent immediately.
+
+        Input contract:
+        - `requests_per_minute` as described on the class.
+
+        Output contract:
+        - Ready-to-use `RateLimiter` instance.
+
+        Side effects:
+        - None.
+        """
+
+        self.interval = 60.0 / requests_per_minute if requests_per_minute > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until the next request slot, then reserve it."""
+
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
@@ -2,39 +2,208 @@
 
 from __future__ import annotations
 
-from typing import Callable, TypedDict
+import atexit
+import os
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable
 
+from core import jsonio
+
+from providers.cache import RESPONSE_CACHE_SIZE, ResponseCache, cache_enabled
+from providers.groq_provider import close as groq_close
 from providers.groq_provider import generate as groq_generate
+from providers.groq_provider import generate_many as groq_generate_many
 from providers.groq_provider import list_models as groq_models
+from providers.ollama import close as ollama_close
 from providers.ollama import generate as ollama_generate
+from providers.ollama import generate_many as ollama_generate_many
+from providers.ollama import generate_stream as ollama_generate_stream
 from providers.ollama import list_models as ollama_models
 
 
-class ProviderEntry(TypedDict):
+# Per-prompt batch results: response text, or the exception that prompt raised.
+BatchGenerate = Callable[[list[str], str, float | None], list[str | Exception]]
+
+
+@dataclass(frozen=True, slots=True)
+class ProviderAdapter:
     """Registry record for one provider backend.
 
     Input contract:
-    - `generate`: callable accepting `(prompt, model)`.
+    - `generate`: callable accepting `(prompt, model, timeout)`, where
+      `timeout` is an HTTP timeout in seconds or `None` for the default.
     - `list_models`: callable returning available model ids.
+    - `generate_many`: coroutine function accepting `(prompts, model, timeout)`
+      and returning, per prompt, the response text or the raised exception.
+    - `generate_batch`: optional native batch API accepting
+      `(prompts, model, timeout)` and returning, per prompt, the response text
+      or the raised exception. Providers without one are fanned out over
+      single calls instead.
+    - `generate_stream`: optional callable yielding text fragments for
+      `(prompt, model, timeout)`.
 
     Output contract:
-    - Uniform callable signatures across providers.
+    - Uniform callable signatures across providers, read as attributes.
 
     Side effects:
     - None.
     """
 
-    generate: Callable[[str, str], str]
+    generate: Callable[[str, str, float | None], str]
     list_models: Callable[[], list[str]]
+    generate_many: Callable[[list[str], str, float | None], Awaitable[list[str | Exception]]]
+    generate_batch: BatchGenerate | None = None
+    generate_stream: Callable[[str, str, float | None], Iterator[str]] | None = None
 
 
-PROVIDERS: dict[str, ProviderEntry] = {
-    "ollama": {
-        "generate": ollama_generate,
-        "list_models": ollama_models,
-    },
-    "groq": {
-        "generate": groq_generate,
-        "list_models": groq_models,
-    },
+PROVIDERS: dict[str, ProviderAdapter] = {
+    "ollama": ProviderAdapter(
+        generate=ollama_generate,
+        list_models=ollama_models,
+        generate_many=ollama_generate_many,
+        generate_stream=ollama_generate_stream,
+    ),
+    "groq": ProviderAdapter(
+        generate=groq_generate,
+        list_models=groq_models,
+        generate_many=groq_generate_many,
+    ),
 }
+
+
+# Exact-match cache of raw responses shared by every generation call;
+# off unless `COMMIT_AGENT_RESPONSE_CACHE=1`, since cached replies would skew
+# lab latency and quality measurements.
+RESPONSE_CACHE = ResponseCache(RESPONSE_CACHE_SIZE if cache_enabled() else 0)
+
+
+def close_all() -> None:
+    """Close pooled HTTP connections held by every provider.
+
+    Input contract:
+    - None.
+
+    Output contract:
+    - No return value.
+
+    Side effects:
+    - Closes provider sessions; registered to run at interpreter exit.
+    """
+
+    for close in (ollama_close, groq_close):
+        close()
+
+
+atexit.register(close_all)
+
+
+
+MODELS_CACHE_PATH = (
+    Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "commit-agent" / "models.json"
+)
+MODELS_CACHE_TTL_SECONDS = 300.0
+
+
+def _refresh_models_requested() -> bool:
+    """Report whether `COMMIT_AGENT_REFRESH_MODELS=1` asks to bypass the model cache.
+
+    Input contract:
+    - Reads the `COMMIT_AGENT_REFRESH_MODELS` environment variable.
+
+    Output contract:
+    - Returns `True` when the variable is set to a truthy value.
+
+    Side effects:
+    - None.
+    """
+
+    return os.getenv("COMMIT_AGENT_REFRESH_MODELS", "").strip().lower() in {"1", "true", "yes"}
+
+
+def _read_models_cache(path: Path) -> dict[str, Any]:
+    """Load the on-disk model list cache.
+
+    Input contract:
+    - `path` points to a JSON cache file, possibly missing.
+
+    Output contract:
+    - Returns mapping of provider name to `{"timestamp", "models"}` entries.
+      Empty dict when missing/invalid.
+
+    Side effects:
+    - Reads from filesystem.
+    """
+
+    try:
+        data = jsonio.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _write_models_cache(path: Path, payload: dict[str, Any]) -> None:
+    """Atomically persist the model list cache; failures are ignored.
+
+    Input contract:
+    - `payload` is JSON-serializable.
+
+    Output contract:
+    - No return value.
+
+    Side effects:
+    - Creates parent directories and replaces `path`.
+    """
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        temp_path.write_bytes(jsonio.dumps_bytes(payload, sort_keys=True))
+        os.replace(temp_path, path)
+    except OSError:
+        return
+
+
+def list_models_cached(
+    provider: str,
+    ttl_seconds: float = MODELS_CACHE_TTL_SECONDS,
+    cache_path: Path = MODELS_CACHE_PATH,
+) -> list[str]:
+    """List provider models, reusing a recent on-disk result.
+
+    Input contract:
+    - `provider` must exist in `PROVIDERS`.
+    - `ttl_seconds` is the maximum age of a reusable cached result.
+    - `COMMIT_AGENT_REFRESH_MODELS=1` forces a fresh provider query.
+
+    Output contract:
+    - Returns model identifiers, possibly from a cache younger than `ttl_seconds`.
+
+    Side effects:
+    - Reads and writes `cache_path`.
+    - Calls the provider's `list_models` on cache miss.
+    """
+
+    if provider not in PROVIDERS:
+        raise KeyError(f"Unknown provider: {provider}")
+
+    cache = _read_models_cache(cache_path)
+    entry = None if _refresh_models_requested() else cache.get(provider)
+    now = time.time()
+    if isinstance(entry, dict):
+        timestamp = entry.get("timestamp")
+        models = entry.get("models")
+        if (
+            isinstance(timestamp, (int, float))
+            and isinstance(models, list)
+            and 0 <= now - timestamp <= ttl_seconds
+        ):
+            return [str(model) for model in models]
+
+    models = PROVIDERS[provider].list_models()
+    if models:
+        cache[provider] = {"timestamp": now, "models": models}
+        _write_models_cache(cache_path, cache)
+    return models
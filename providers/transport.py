@@ -0,0 +1,164 @@
+"""Shared HTTP transport setup for provider adapters.
+
+This module only builds pooled HTTP clients; it does not know about any
+provider's endpoints or payloads. `COMMIT_AGENT_TRANSPORT=urllib3` lets
+adapters bypass the `requests` wrapper and talk to a bare urllib3 pool.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import requests
+from requests.adapters import HTTPAdapter
+
+if TYPE_CHECKING:
+    import urllib3
+
+RETRY_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+TRANSPORT_BACKENDS = ("requests", "urllib3")
+
+
+def transport_backend() -> str:
+    """Return the HTTP backend selected via `COMMIT_AGENT_TRANSPORT`.
+
+    Input contract:
+    - Reads the `COMMIT_AGENT_TRANSPORT` environment variable.
+
+    Output contract:
+    - Returns one of `TRANSPORT_BACKENDS`; unknown values select `requests`.
+
+    Side effects:
+    - None.
+    """
+
+    backend = os.getenv("COMMIT_AGENT_TRANSPORT", "requests").strip().lower()
+    return backend if backend in TRANSPORT_BACKENDS else "requests"
+
+
+def build_session(pool_connections: int = 4, pool_maxsize: int = 8) -> requests.Session:
+    """Create a keep-alive session with a sized connection pool.
+
+    Input contract:
+    - `pool_connections` is the number of distinct hosts to keep pools for.
+    - `pool_maxsize` is the number of reusable connections per host; size it
+      to the provider's expected concurrent calls.
+
+    Output contract:
+    - Returns a `requests.Session` whose HTTP and HTTPS adapters reuse
+      connections. Requests are never retried here; retrying is left to the
+      engine's attempt loop.
+
+    Side effects:
+    - None until the session is used.
+    """
+
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def build_pool(num_pools: int = 2, maxsize: int = 8) -> urllib3.PoolManager:
+    """Create a bare urllib3 pool that never retries or follows redirects.
+
+    Input contract:
+    - `num_pools` is the number of distinct hosts to keep pools for.
+    - `maxsize` is the number of reusable connections per host.
+
+    Output contract:
+    - Returns a `urllib3.PoolManager` for use with `pool_request`; redirect
+      responses are handed back to the caller instead of being followed.
+
+    Side effects:
+    - Imports urllib3 on first use.
+    """
+
+    import urllib3
+    from urllib3.util.retry import Retry
+
+    return urllib3.PoolManager(
+        num_pools=num_pools,
+        maxsize=maxsize,
+        retries=Retry(total=0, read=False, redirect=False),
+    )
+
+
+def pool_request(
+    pool: urllib3.PoolManager,
+    method: str,
+    url: str,
+    *,
+    headers: dict[str, str],
+    timeout: float,
+    body: bytes | None = None,
+) -> bytes:
+    """Send one request through a urllib3 pool and return the response body.
+
+    Input contract:
+    - `body` is an already-serialized request payload, if any.
+
+    Output contract:
+    - Returns the raw response bytes for 2xx responses.
+    - Raises `requests.HTTPError` (with `response.status_code` set) for
+      redirect and error statuses and `requests.ConnectionError` for transport
+      failures, so callers handle both backends the same way. Redirects are
+      not followed and are not classified as transient.
+
+    Side effects:
+    - Performs network I/O over pooled connections.
+    """
+
+    from urllib3.exceptions import HTTPError as Urllib3HTTPError
+
+    try:
+        response = pool.request(method, url, headers=headers, body=body, timeout=timeout)
+    except Urllib3HTTPError as exc:
+        raise requests.ConnectionError(str(exc)) from exc
+    if response.status >= 300:
+        error_response = requests.Response()
+        error_response.status_code = response.status
+        error_response.reason = response.reason
+        error_response.url = url
+        raise requests.HTTPError(
+            f"{response.status} Error: {response.reason} for url: {url}",
+            response=error_response,
+        )
+    return response.data
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    """Classify a provider failure as worth another attempt.
+
+    Input contract:
+    - `exc` is any exception raised by a provider call.
+
+    Output contract:
+    - Returns `True` for connection failures, timeouts, dropped streams, and HTTP
+      408/425/429/5xx responses; `False` for TLS/certificate, auth,
+      validation, and payload errors.
+
+    Side effects:
+    - None.
+    """
+
+    status_code = getattr(getattr(exc, "response", None), "status_code", None)
+    if isinstance(status_code, int):
+        return status_code in RETRY_STATUS_CODES
+    if isinstance(exc, requests.exceptions.SSLError):
+        return False
+    return isinstance(
+        exc,
+        (
+            requests.ConnectionError,
+            requests.Timeout,
+            requests.exceptions.ChunkedEncodingError,
+            ConnectionError,
+            TimeoutError,
+        ),
+    )
@@ -0,0 +1,61 @@
+"""Shared pytest fixtures."""
+
+from __future__ import annotations
+
+import dataclasses
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from core import jsonio
+from core.types import DiffContext
+from providers.registry import PROVIDERS
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+
+@pytest.fixture(autouse=True)
+def repo_cwd(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Run every test from the repository root so `prompts/` resolves."""
+
+    monkeypatch.chdir(REPO_ROOT)
+
+
+@pytest.fixture
+def valid_commit_json() -> str:
+    """Return a raw provider reply that parses into a valid commit."""
+
+    return jsonio.dumps(
+        {
+            "type": "feat",
+            "scope": None,
+            "subject": "add a concurrent runner for lab experiments",
+            "body": "fans out lab targets across worker threads and keeps results in input order",
+        }
+    )
+
+
+@pytest.fixture
+def diff_context() -> DiffContext:
+    """Return a small staged-diff snapshot."""
+
+    return DiffContext(
+        diff="diff --git a/app.py b/app.py\n@@ -1 +1 @@\n-old\n+new\n",
+        status="M  app.py",
+        files_changed=["app.py"],
+        insertions=1,
+        deletions=1,
+    )
+
+
+@pytest.fixture
+def fake_provider(monkeypatch: pytest.MonkeyPatch) -> Callable[..., None]:
+    """Return a helper that swaps adapter callables for one registry entry."""
+
+    def install(name: str, **callables: Any) -> None:
+        monkeypatch.setitem(PROVIDERS, name, dataclasses.replace(PROVIDERS[name], **callables))
+
+    return install
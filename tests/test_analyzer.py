@@ -0,0 +1,35 @@
+"""Tests for porcelain status parsing and diff statistics."""
+
+from __future__ import annotations
+
+from core.analyzer import (
+    _count_diff_stats,
+    _format_status,
+    _parse_changed_files,
+    _split_status_entries,
+)
+
+
+def test_split_status_entries_reads_index_rename_source() -> None:
+    entries = _split_status_entries(b"R  new.py\x00old.py\x00M  app.py\x00")
+
+    assert entries == [(b"R ", b"new.py", b"old.py"), (b"M ", b"app.py", None)]
+
+
+def test_split_status_entries_reads_worktree_rename_source() -> None:
+    entries = _split_status_entries(b" R new.py\x00old.py\x00?? notes.txt\x00")
+
+    assert entries == [(b" R", b"new.py", b"old.py"), (b"??", b"notes.txt", None)]
+
+
+def test_renamed_entries_report_new_path_and_arrow_format() -> None:
+    entries = _split_status_entries(b"C  copy.py\x00src.py\x00 M app.py\x00")
+
+    assert _parse_changed_files(entries) == ["copy.py", "app.py"]
+    assert _format_status(entries) == "C  src.py -> copy.py\n M app.py"
+
+
+def test_count_diff_stats_ignores_file_headers() -> None:
+    diff = b"--- a/app.py\n+++ b/app.py\n@@ -1,2 +1,2 @@\n-old\n+new\n+extra\n"
+
+    assert _count_diff_stats(diff) == (2, 1)
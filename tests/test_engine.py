@@ -0,0 +1,160 @@
+"""Tests for matrix execution, the fallback pass, and hedged production runs."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Iterator
+
+import pytest
+
+import core.engine as engine
+from config.loader import ConstraintConfig, FallbackConfig, LabSingleConfig, ProdConfig
+from core.types import DiffContext
+from providers import groq_provider
+
+LOOSE = ConstraintConfig(min=1, max=200)
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Retry immediately instead of sleeping between attempts."""
+
+    monkeypatch.setattr(engine, "RETRY_BASE_DELAY_SECONDS", 0.0)
+
+
+@pytest.fixture
+def groq_key(monkeypatch: pytest.MonkeyPatch) -> Iterator[Callable[[str | None], None]]:
+    """Return a helper that sets or clears `GROQ_API_KEY` for one test."""
+
+    def set_key(value: str | None) -> None:
+        if value is None:
+            monkeypatch.delenv("GROQ_API_KEY", raising=False)
+        else:
+            monkeypatch.setenv("GROQ_API_KEY", value)
+        groq_provider._reset_config()
+
+    yield set_key
+    groq_provider._reset_config()
+
+
+def test_run_matrix_returns_results_in_target_order(
+    fake_provider: Callable[..., None], diff_context: DiffContext, valid_commit_json: str
+) -> None:
+    fake_provider("groq", generate=lambda prompt, model, timeout=None: valid_commit_json)
+    fake_provider("ollama", generate=lambda prompt, model, timeout=None: valid_commit_json)
+    targets = [
+        LabSingleConfig(provider, model, strategy, LOOSE)
+        for strategy in ("structured", "zero_shot")
+        for provider, model in (("groq", "g-1"), ("ollama", "o-1"), ("groq", "g-2"))
+    ]
+    finished: list[int] = []
+
+    results = engine.run_matrix(
+        targets,
+        diff_context,
+        max_retries=0,
+        on_group_done=lambda indices, _: finished.extend(indices),
+    )
+
+    assert [(r.meta["provider"], r.meta["model"], r.meta["strategy"]) for r in results] == [
+        (t.provider, t.model, t.strategy) for t in targets
+    ]
+    assert all(r.commit is not None for r in results)
+    assert sorted(finished) == list(range(len(targets)))
+
+
+def test_run_matrix_fallback_pass_reruns_failed_targets(
+    fake_provider: Callable[..., None], diff_context: DiffContext, valid_commit_json: str
+) -> None:
+    calls: dict[str, int] = {}
+    lock = threading.Lock()
+
+    def generate(prompt: str, model: str, timeout: float | None = None) -> str:
+        with lock:
+            calls[model] = calls.get(model, 0) + 1
+        if model == "broken":
+            raise RuntimeError("boom")
+        return valid_commit_json
+
+    fake_provider("groq", generate=generate)
+    targets = [
+        LabSingleConfig("groq", "ok", "structured", LOOSE),
+        LabSingleConfig("groq", "broken", "structured", LOOSE),
+    ]
+
+    ok, broken = engine.run_matrix(targets, diff_context, max_retries=0)
+
+    assert ok.commit is not None and ok.meta["fallback_used"] is False
+    assert broken.commit is None
+    assert broken.meta["fallback_used"] is True
+    assert broken.meta["primary_error"] == "provider_error"
+    assert calls == {"ok": 1, "broken": 2}
+
+
+def _prod_config(hedge_delay_seconds: float | None) -> ProdConfig:
+    return ProdConfig(
+        strategy="structured",
+        provider="ollama",
+        model="slow",
+        fallback=FallbackConfig(provider="groq", model="fast", strategy="zero_shot"),
+        constraints=LOOSE,
+        max_retries=0,
+        timeout_seconds=5,
+        hedge_delay_seconds=hedge_delay_seconds,
+    )
+
+
+@pytest.fixture
+def slow_primary(
+    fake_provider: Callable[..., None],
+    monkeypatch: pytest.MonkeyPatch,
+    diff_context: DiffContext,
+    valid_commit_json: str,
+) -> threading.Event:
+    """Install a slow streaming Ollama primary and a fast Groq fallback."""
+
+    closed = threading.Event()
+
+    def stream(prompt: str, model: str, timeout: float | None = None) -> Iterator[str]:
+        try:
+            for _ in range(50):
+                time.sleep(0.02)
+                yield ""
+            yield valid_commit_json
+        finally:
+            closed.set()
+
+    fake_provider(
+        "ollama",
+        generate=lambda prompt, model, timeout=None: "".join(stream(prompt, model, timeout)),
+        generate_stream=stream,
+    )
+    fake_provider("groq", generate=lambda prompt, model, timeout=None: valid_commit_json)
+    monkeypatch.setattr(engine, "read_git_context", lambda debug=False: diff_context)
+    return closed
+
+
+def test_run_once_hedge_returns_fallback_and_cancels_primary(
+    slow_primary: threading.Event, groq_key: Callable[[str | None], None]
+) -> None:
+    groq_key("test-key")
+
+    result = engine.run_once(_prod_config(hedge_delay_seconds=0.05))
+
+    assert result.commit is not None
+    assert result.meta["provider"] == "groq"
+    assert result.meta["hedged"] is True
+    assert slow_primary.wait(timeout=2.0)
+
+
+def test_run_once_skips_hedge_without_groq_key(
+    slow_primary: threading.Event, groq_key: Callable[[str | None], None]
+) -> None:
+    groq_key(None)
+
+    result = engine.run_once(_prod_config(hedge_delay_seconds=0.05))
+
+    assert result.commit is not None
+    assert result.meta["provider"] == "ollama"
+    assert result.meta["hedged"] is False
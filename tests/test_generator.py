@@ -0,0 +1,81 @@
+"""Tests for diff trimming and cancellable stream collection."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+
+import pytest
+
+from core.generator import GenerationCancelled, _collect_stream, _trim_diff
+
+
+def _diff(files: int, lines_per_file: int, text: str = "line") -> str:
+    blocks = []
+    for index in range(files):
+        body = "".join(f"+{text} {n}\n" for n in range(lines_per_file))
+        blocks.append(
+            f"diff --git a/f{index} b/f{index}\n@@ -0,0 +1,{lines_per_file} @@\n{body}"
+        )
+    return "".join(blocks)
+
+
+def test_trim_diff_keeps_small_diffs_unchanged() -> None:
+    diff = _diff(1, 3)
+
+    assert _trim_diff(diff, max_bytes=len(diff)) is diff
+
+
+@pytest.mark.parametrize("text", ["line", "ligne modifiée ✓"])
+@pytest.mark.parametrize("max_bytes", [64, 300, 1000])
+def test_trim_diff_stays_within_byte_budget(text: str, max_bytes: int) -> None:
+    diff = _diff(12, 8, text)
+
+    trimmed = _trim_diff(diff, max_bytes=max_bytes)
+
+    assert len(trimmed.encode("utf-8")) <= max_bytes
+    assert trimmed != diff
+
+
+def test_trim_diff_keeps_head_and_tail() -> None:
+    diff = _diff(12, 8)
+
+    trimmed = _trim_diff(diff, max_bytes=600)
+
+    assert trimmed.startswith("diff --git a/f0 b/f0\n")
+    assert trimmed.endswith(diff[-20:])
+
+
+def test_collect_stream_joins_fragments_and_closes() -> None:
+    closed = threading.Event()
+
+    def fragments() -> Iterator[str]:
+        try:
+            yield from ("a", "b", "c")
+        finally:
+            closed.set()
+
+    assert _collect_stream(fragments(), threading.Event()) == "abc"
+    assert closed.is_set()
+
+
+def test_collect_stream_stops_and_closes_when_cancelled() -> None:
+    cancel = threading.Event()
+    closed = threading.Event()
+    seen: list[str] = []
+
+    def fragments() -> Iterator[str]:
+        try:
+            for index in range(100):
+                seen.append(str(index))
+                if index == 2:
+                    cancel.set()
+                yield str(index)
+        finally:
+            closed.set()
+
+    with pytest.raises(GenerationCancelled):
+        _collect_stream(fragments(), cancel)
+
+    assert closed.is_set()
+    assert len(seen) == 3
@@ -0,0 +1,42 @@
+"""Tests for the stdlib fallback in `core.jsonio`."""
+
+from __future__ import annotations
+
+import pytest
+
+from core import jsonio
+
+
+@pytest.fixture
+def stdlib_json(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Force the stdlib backend even when `orjson` is installed."""
+
+    monkeypatch.setattr(jsonio, "orjson", None)
+
+
+@pytest.mark.usefixtures("stdlib_json")
+def test_fallback_dumps_compact_sorted_utf8() -> None:
+    payload = {"b": "é", "a": [1, None]}
+
+    assert jsonio.dumps_bytes(payload, sort_keys=True, newline=True) == (
+        '{"a":[1,null],"b":"é"}\n'.encode("utf-8")
+    )
+
+
+@pytest.mark.usefixtures("stdlib_json")
+def test_fallback_round_trips_bytes() -> None:
+    assert jsonio.loads(b'{"subject": "fix"}') == {"subject": "fix"}
+
+
+@pytest.mark.usefixtures("stdlib_json")
+def test_fallback_reports_invalid_utf8_as_decode_error() -> None:
+    with pytest.raises(jsonio.JSONDecodeError):
+        jsonio.loads(b'{"subject": "\xff"}')
+
+
+def test_fallback_matches_active_backend(monkeypatch: pytest.MonkeyPatch) -> None:
+    payload = {"z": 1, "a": {"nested": ["é", 2.5]}}
+    expected = jsonio.dumps_bytes(payload, sort_keys=True, indent=True)
+    monkeypatch.setattr(jsonio, "orjson", None)
+
+    assert jsonio.dumps_bytes(payload, sort_keys=True, indent=True) == expected
@@ -0,0 +1,77 @@
+"""Tests for provider-side request pacing and response caching."""
+
+from __future__ import annotations
+
+import pytest
+
+from providers import ratelimit
+from providers.cache import ResponseCache, response_cache_key
+from providers.ratelimit import RateLimiter
+
+
+class _FakeClock:
+    """Monotonic clock whose `sleep` advances time instead of blocking."""
+
+    def __init__(self) -> None:
+        self.now = 100.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_rate_limiter_spaces_requests_evenly(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = _FakeClock()
+    monkeypatch.setattr(ratelimit.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(ratelimit.time, "sleep", clock.sleep)
+    limiter = RateLimiter(requests_per_minute=30)
+
+    for _ in range(3):
+        limiter.acquire()
+
+    assert limiter.interval == pytest.approx(2.0)
+    assert clock.sleeps == [pytest.approx(2.0), pytest.approx(2.0)]
+
+
+def test_rate_limiter_disabled_never_sleeps(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = _FakeClock()
+    monkeypatch.setattr(ratelimit.time, "sleep", clock.sleep)
+    limiter = RateLimiter(requests_per_minute=0)
+
+    limiter.acquire()
+    limiter.acquire()
+
+    assert clock.sleeps == []
+
+
+def test_response_cache_evicts_least_recently_used() -> None:
+    cache = ResponseCache(maxsize=2)
+    first, second, third = (response_cache_key("groq", "m", prompt) for prompt in "abc")
+    cache.put(first, "one")
+    cache.put(second, "two")
+
+    assert cache.get(first) == "one"
+    cache.put(third, "three")
+
+    assert cache.get(second) is None
+    assert cache.get(first) == "one"
+    assert cache.get(third) == "three"
+
+
+def test_response_cache_keys_retries_separately() -> None:
+    cache = ResponseCache(maxsize=4)
+    cache.put(response_cache_key("groq", "m", "prompt", attempt=0), "first")
+
+    assert cache.get(response_cache_key("groq", "m", "prompt", attempt=1)) is None
+
+
+def test_response_cache_with_zero_size_stores_nothing() -> None:
+    cache = ResponseCache(maxsize=0)
+    key = response_cache_key("groq", "m", "prompt")
+    cache.put(key, "reply")
+
+    assert cache.get(key) is None